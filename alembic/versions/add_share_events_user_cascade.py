@@ -0,0 +1,28 @@
+"""Cascade share_events deletes from users
+
+Revision ID: add_share_events_user_cascade
+Revises: add_feedback_contact_fields
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_share_events_user_cascade'
+down_revision = 'add_feedback_contact_fields'
+branch_labels = None
+depends_on = None
+
+# MySQL's auto-generated name for the share_events.user_id foreign key
+FK_NAME = 'share_events_ibfk_1'
+
+
+def upgrade() -> None:
+    # Recreate the user foreign key so deleting a user removes its share events
+    op.drop_constraint(FK_NAME, 'share_events', type_='foreignkey')
+    op.create_foreign_key(FK_NAME, 'share_events', 'users', ['user_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    op.drop_constraint(FK_NAME, 'share_events', type_='foreignkey')
+    op.create_foreign_key(FK_NAME, 'share_events', 'users', ['user_id'], ['id'])
@@ -0,0 +1,40 @@
+"""Add (is_admin, created_at) and (is_admin, current_rank) indexes to users
+
+Revision ID: add_users_is_admin_composite_indexes
+Revises: add_share_events_user_cascade
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_users_is_admin_composite_indexes'
+down_revision = 'add_share_events_user_cascade'
+branch_labels = None
+depends_on = None
+
+# Composite indexes declared on User; migrate_ranking_system.py may already
+# have created them alongside the rank columns
+INDEXES = {
+    'idx_users_is_admin_created_at': ['is_admin', 'created_at'],
+    'idx_users_is_admin_current_rank': ['is_admin', 'current_rank'],
+}
+
+
+def _existing_indexes():
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('users')}
+
+
+def upgrade() -> None:
+    existing = _existing_indexes()
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'users', columns, unique=False)
+
+
+def downgrade() -> None:
+    existing = _existing_indexes()
+    for name in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name='users')
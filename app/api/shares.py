@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db
-from app.schemas.share import ShareCreate, ShareResponse, ShareHistoryResponse, ShareHistoryItem, ShareAnalyticsResponse
-from app.services.share_service import log_share_event
+from app.schemas.share import ShareCreate, ShareResponse, ShareHistoryResponse, ShareHistoryItem, ShareAnalyticsResponse, BulkShareCreate, BulkShareItem, BulkShareResponse
+from app.services.share_service import log_share_event, log_share_events
 from app.core.security import verify_access_token
 from fastapi.security import OAuth2PasswordBearer
 from app.models.share import ShareEvent, PlatformEnum
@@ -13,6 +13,76 @@ from app.utils.monitoring import inc_share_event
 router = APIRouter(prefix="/shares", tags=["shares"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Registered before /{platform} so "bulk" isn't parsed as a platform name
+@router.post("/bulk", response_model=BulkShareResponse, status_code=201)
+def share_bulk(
+    request: BulkShareCreate,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+):
+    """
+    Record share events on several platforms in one request.
+
+    Points follow the same rule as the single-platform endpoint: only the
+    first share per platform per user earns points.
+
+    Args:
+        request: Non-empty list of share events, one per platform
+        token: JWT access token
+        db: Database session
+
+    Returns:
+        BulkShareResponse: Points earned per platform and the user's new totals
+
+    Raises:
+        HTTPException: If token is invalid, the list is empty, a platform is
+            unknown, or share logging fails
+    """
+    try:
+        # Verify access token
+        payload = verify_access_token(token)
+        if not payload:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+        try:
+            platforms = [PlatformEnum(event.platform) for event in request.events]
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+        # Log all share events in one batch
+        user, awarded = log_share_events(db, payload["user_id"], platforms)
+
+        # Update metrics, once per share like the single-platform endpoint
+        for _ in awarded:
+            inc_share_event()
+
+        points_earned = sum(points for _, points in awarded)
+        return BulkShareResponse(
+            user_id=user.id,
+            shares=[BulkShareItem(platform=platform.value, points_earned=points) for platform, points in awarded],
+            points_earned=points_earned,
+            total_points=user.total_points,
+            new_rank=user.current_rank,
+            timestamp=datetime.utcnow(),
+            message=f"Shares recorded successfully! You earned {points_earned} points. Current rank: {user.current_rank}"
+        )
+
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except Exception as e:
+        # Log unexpected errors
+        import logging
+        logging.getLogger(__name__).error(f"Bulk share logging failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to record share events"
+        )
+
 @router.post("/{platform}", response_model=ShareResponse, status_code=201)
 def share(
     platform: PlatformEnum = Path(..., description="Platform to share on (facebook, twitter, linkedin, instagram, whatsapp)"),
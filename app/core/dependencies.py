@@ -3,7 +3,14 @@ from sqlalchemy import create_engine
 from app.core.config import settings
 from diskcache import Cache
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_use_lifo=True  # Reuse the most recent connection so idle ones can expire
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 cache = Cache(settings.CACHE_DIR)
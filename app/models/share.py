@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
 from app.core.database import Base
 import enum
 
@@ -12,10 +13,13 @@ class PlatformEnum(enum.Enum):
 class ShareEvent(Base):
     __tablename__ = "share_events"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     platform = Column(Enum(PlatformEnum), index=True)
     points_earned = Column(Integer, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Relationship to user
+    user = relationship("User", back_populates="share_events")
+
 Index('idx_share_events_user_id', ShareEvent.user_id)
 Index('idx_share_events_platform', ShareEvent.platform) 
\ No newline at end of file
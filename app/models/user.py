@@ -20,8 +20,12 @@ class User(Base):
 
     # Relationships
     feedback_responses = relationship("Feedback", back_populates="user")
+    # Share events are removed by the database's ON DELETE CASCADE
+    share_events = relationship("ShareEvent", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
 Index('idx_users_total_points', User.total_points)
 Index('idx_users_email', User.email)
 Index('idx_users_current_rank', User.current_rank)
-Index('idx_users_default_rank', User.default_rank)
\ No newline at end of file
+Index('idx_users_default_rank', User.default_rank)
+Index('idx_users_is_admin_created_at', User.is_admin, User.created_at)
+Index('idx_users_is_admin_current_rank', User.is_admin, User.current_rank)
\ No newline at end of file
@@ -1,10 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
 
 class ShareCreate(BaseModel):
     platform: str
 
+class BulkShareCreate(BaseModel):
+    events: List[ShareCreate] = Field(..., min_length=1)
+
 class ShareResponse(BaseModel):
     share_id: Optional[int]
     user_id: int
@@ -15,6 +18,19 @@ class ShareResponse(BaseModel):
     timestamp: datetime
     message: str
 
+class BulkShareItem(BaseModel):
+    platform: str
+    points_earned: int
+
+class BulkShareResponse(BaseModel):
+    user_id: int
+    shares: List[BulkShareItem]
+    points_earned: int
+    total_points: int
+    new_rank: Optional[int]
+    timestamp: datetime
+    message: str
+
 class ShareHistoryItem(BaseModel):
     share_id: int
     platform: str
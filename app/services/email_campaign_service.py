@@ -16,6 +16,7 @@ from app.models.user import User
 from app.services.email_service import send_email
 from app.core.dependencies import get_db
 from datetime import datetime, timezone
+from functools import lru_cache
 import pytz
 import logging
 
@@ -133,6 +134,26 @@ The LawVriksh Team
     }
 }
 
+# Templates split around their only placeholder, {name}, once at import so
+# rendering is a single join instead of a str.format parse per email
+_TEMPLATE_PARTS = {
+    campaign_type: template["template"].split("{name}")
+    for campaign_type, template in EMAIL_TEMPLATES.items()
+}
+
+def render_campaign_template(campaign_type: str, user_name: str) -> str:
+    """
+    Render a campaign email body for a user.
+    
+    Args:
+        campaign_type: Type of campaign (key of EMAIL_TEMPLATES)
+        user_name: User's name
+        
+    Returns:
+        str: The rendered email body
+    """
+    return user_name.join(_TEMPLATE_PARTS[campaign_type])
+
 def send_welcome_email_campaign(user_email: str, user_name: str):
     """
     Send the instant welcome email when user signs up.
@@ -146,7 +167,7 @@ def send_welcome_email_campaign(user_email: str, user_name: str):
         # Send welcome email immediately
         template = EMAIL_TEMPLATES["welcome"]
         subject = template["subject"]
-        body = template["template"].format(name=user_name)
+        body = render_campaign_template("welcome", user_name)
         send_email(user_email, subject, body)
         logger.info(f"Welcome email sent to {user_email} ({user_name})")
 
@@ -195,7 +216,7 @@ def send_scheduled_campaign_email(campaign_type: str, user_email: str, user_name
         
         template = EMAIL_TEMPLATES[campaign_type]
         subject = template["subject"]
-        body = template["template"].format(name=user_name)
+        body = render_campaign_template(campaign_type, user_name)
         
         # Send email
         send_email(user_email, subject, body)
@@ -245,13 +266,9 @@ def send_bulk_campaign_email(campaign_type: str, db: Session):
         logger.error(f"Failed to send bulk campaign '{campaign_type}': {e}")
         return 0, 0
 
-def get_campaign_schedule():
-    """
-    Get the complete campaign schedule.
-    
-    Returns:
-        dict: Campaign schedule information
-    """
+@lru_cache(maxsize=1)
+def _build_campaign_schedule() -> dict:
+    """Build the schedule from EMAIL_TEMPLATES once; the templates are static."""
     schedule = {}
     
     for campaign_type, template in EMAIL_TEMPLATES.items():
@@ -263,6 +280,19 @@ def get_campaign_schedule():
     
     return schedule
 
+def get_campaign_schedule():
+    """
+    Get the complete campaign schedule.
+    
+    Returns:
+        dict: Campaign schedule information
+    """
+    # Callers annotate the entries in place, so hand out copies of the cached ones
+    return {
+        campaign_type: dict(details)
+        for campaign_type, details in _build_campaign_schedule().items()
+    }
+
 def is_campaign_due(campaign_type: str) -> bool:
     """
     Check if a campaign is due to be sent.
@@ -2,10 +2,15 @@ import smtplib
 import logging
 from email.mime.text import MIMEText
 from app.core.config import settings
-from typing import List
+from typing import List, Optional
 
-def send_welcome_email(user_email: str, user_name: str):
-    """Send welcome email to new user."""
+def send_welcome_email(user_email: str, user_name: str, smtp: Optional[smtplib.SMTP] = None):
+    """
+    Send welcome email to new user.
+
+    If smtp is an already connected and authenticated SMTP session, the email
+    is sent on it and the session is left open for the caller to reuse.
+    """
     try:
         subject = "✨ Welcome to LawVriksh - Help Us Build Something Amazing!"
         body = f"""Hello {user_name},
@@ -30,11 +35,14 @@ The LawVriksh Team
         msg["From"] = settings.EMAIL_FROM
         msg["To"] = user_email
         
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-            server.starttls()
-            if settings.SMTP_USER and settings.SMTP_PASSWORD:
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.sendmail(settings.EMAIL_FROM, [user_email], msg.as_string())
+        if smtp is not None:
+            smtp.sendmail(settings.EMAIL_FROM, [user_email], msg.as_string())
+        else:
+            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
+                server.starttls()
+                if settings.SMTP_USER and settings.SMTP_PASSWORD:
+                    server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+                server.sendmail(settings.EMAIL_FROM, [user_email], msg.as_string())
         
         logging.info(f"Welcome email sent successfully to {user_email}")
     except Exception as e:
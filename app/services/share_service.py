@@ -1,4 +1,6 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from typing import List, Tuple
 from app.models.share import ShareEvent, PlatformEnum
 from app.models.user import User
 from app.utils.cache import invalidate_leaderboard_cache
@@ -58,4 +60,62 @@ def log_share_event(db: Session, user_id: int, platform: PlatformEnum):
         return share, user, points
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=500, detail="Failed to record share event")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to record share event")
+
+def log_share_events(db: Session, user_id: int, platforms: List[PlatformEnum]) -> Tuple[User, List[Tuple[PlatformEnum, int]]]:
+    """
+    Record shares on several platforms at once, with the same first-share-only
+    points rule as log_share_event. New share events are inserted in a single
+    executemany and the user's rank is recalculated once.
+
+    Returns the user and the (platform, points) pairs for every platform
+    requested; platforms already shared on earn 0 points.
+    """
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # Find every requested platform the user has already shared on in one query
+    already_shared = {
+        platform for (platform,) in db.query(ShareEvent.platform).filter(
+            ShareEvent.user_id == user_id,
+            ShareEvent.platform.in_(platforms)
+        )
+    }
+
+    awarded = []
+    new_platforms = set()
+    for platform in platforms:
+        if platform in already_shared or platform in new_platforms:
+            awarded.append((platform, 0))
+        else:
+            new_platforms.add(platform)
+            awarded.append((platform, PLATFORM_POINTS[platform]))
+
+    if not new_platforms:
+        return user, awarded
+
+    now = datetime.utcnow()
+    rows = [
+        {"user_id": user.id, "platform": platform, "points_earned": PLATFORM_POINTS[platform], "created_at": now}
+        for platform in new_platforms
+    ]
+
+    try:
+        db.execute(insert(ShareEvent), rows)
+        user.total_points += sum(row["points_earned"] for row in rows)
+        user.shares_count += len(rows)
+        db.commit()
+
+        # Update user's dynamic rank once for the whole batch
+        from app.services.ranking_service import update_user_rank
+        update_user_rank(db, user.id)
+
+        # Refresh user to get updated points and rank
+        db.refresh(user)
+
+        invalidate_leaderboard_cache()
+        return user, awarded
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Failed to record share events")
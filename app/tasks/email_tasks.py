@@ -1,5 +1,6 @@
 import logging
-from celery import Celery
+from datetime import datetime
+from celery import Celery, group
 from app.services.email_service import send_welcome_email, send_bulk_email
 from app.core.config import settings
 
@@ -9,7 +10,10 @@ celery_app = Celery(
     backend='rpc://'  # Use RPC backend for development
 )
 
-@celery_app.task(bind=True, max_retries=3)
+# Welcome emails are acked only after they are sent, so a signup burst isn't
+# lost if a worker dies mid-send. Sending one twice is harmless, unlike a
+# redelivered bulk or campaign send
+@celery_app.task(bind=True, max_retries=3, acks_late=True, reject_on_worker_lost=True)
 def send_welcome_email_task(self, user_email: str, user_name: str):
     """Send a welcome email to a new user asynchronously."""
     try:
@@ -108,18 +112,23 @@ def process_due_campaigns_task():
         due_campaigns = get_due_campaigns()
         results = []
 
-        for campaign_type in due_campaigns:
-            result = send_bulk_campaign_task.delay(campaign_type)
-            results.append({
-                "campaign_type": campaign_type,
-                "task_id": result.id,
-                "status": "queued"
-            })
+        if due_campaigns:
+            # Publish every due campaign in one group so they share a producer
+            # and connection instead of one round trip per .delay()
+            group_result = group(
+                send_bulk_campaign_task.s(campaign_type) for campaign_type in due_campaigns
+            ).apply_async()
+            for campaign_type, result in zip(due_campaigns, group_result.results):
+                results.append({
+                    "campaign_type": campaign_type,
+                    "task_id": result.id,
+                    "status": "queued"
+                })
 
         return {
             "due_campaigns": len(due_campaigns),
             "campaigns_queued": results,
-            "processed_at": str(logging.datetime.now())
+            "processed_at": str(datetime.now())
         }
     except Exception as exc:
         logging.error(f"Failed to process due campaigns: {exc}")
@@ -31,23 +31,26 @@ class CodeAnalyzer:
                 content = f.read()
                 tree = ast.parse(content)
             
+            # Walk the tree once and share the node list between the AST checks
+            nodes = list(ast.walk(tree))
+            
             # Check for various code smells
-            issues.extend(self._check_function_length(tree, file_path))
+            issues.extend(self._check_function_length(nodes, file_path))
             issues.extend(self._check_duplicate_code(content, file_path))
-            issues.extend(self._check_error_handling(tree, file_path))
+            issues.extend(self._check_error_handling(nodes, file_path))
             issues.extend(self._check_security_issues(content, file_path))
-            issues.extend(self._check_performance_issues(tree, file_path))
+            issues.extend(self._check_performance_issues(nodes, file_path))
             
         except Exception as e:
             logger.error(f"Error analyzing {file_path}: {e}")
         
         return issues
     
-    def _check_function_length(self, tree: ast.AST, file_path: Path) -> List[Dict[str, Any]]:
+    def _check_function_length(self, nodes: List[ast.AST], file_path: Path) -> List[Dict[str, Any]]:
         """Check for overly long functions."""
         issues = []
         
-        for node in ast.walk(tree):
+        for node in nodes:
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 # Count lines in function
                 if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
@@ -92,11 +95,11 @@ class CodeAnalyzer:
         
         return issues
     
-    def _check_error_handling(self, tree: ast.AST, file_path: Path) -> List[Dict[str, Any]]:
+    def _check_error_handling(self, nodes: List[ast.AST], file_path: Path) -> List[Dict[str, Any]]:
         """Check for poor error handling patterns."""
         issues = []
         
-        for node in ast.walk(tree):
+        for node in nodes:
             # Check for bare except clauses
             if isinstance(node, ast.ExceptHandler):
                 if node.type is None:
@@ -158,11 +161,11 @@ class CodeAnalyzer:
         
         return issues
     
-    def _check_performance_issues(self, tree: ast.AST, file_path: Path) -> List[Dict[str, Any]]:
+    def _check_performance_issues(self, nodes: List[ast.AST], file_path: Path) -> List[Dict[str, Any]]:
         """Check for performance issues."""
         issues = []
         
-        for node in ast.walk(tree):
+        for node in nodes:
             # Check for inefficient loops
             if isinstance(node, ast.For):
                 # Look for list comprehensions that could be generators
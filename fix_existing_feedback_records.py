@@ -13,6 +13,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.core.config import settings
 
+# Rows updated per transaction; keeps each UPDATE's locks and undo log bounded
+FIX_BATCH_SIZE = 1000
+
 def fix_existing_records():
     """Update existing feedback records with default email and name values"""
     print("🔄 Fixing existing feedback records...")
@@ -26,47 +29,48 @@ def fix_existing_records():
             trans = conn.begin()
             
             try:
-                # Check for records with empty email or name
-                result = conn.execute(text("""
-                    SELECT id, email, name 
-                    FROM feedback 
+                # Derive the replacement values from the row id on the server,
+                # fixing the affected records with set-based UPDATEs committed
+                # in chunks of FIX_BATCH_SIZE rows (fixed rows stop matching
+                # the WHERE clause, so each pass picks up the next chunk)
+                fix_batch = text("""
+                    UPDATE feedback 
+                    SET email = CASE
+                            WHEN email IS NULL OR email = '' OR email = 'unknown@example.com'
+                            THEN CONCAT('legacy_user_', id, '@lawvriksh.com')
+                            ELSE email
+                        END,
+                        name = CASE
+                            WHEN name IS NULL OR name = '' OR name = 'Unknown User'
+                            THEN CONCAT('Legacy User ', id)
+                            ELSE name
+                        END
                     WHERE email = 'unknown@example.com' OR name = 'Unknown User'
                     OR email IS NULL OR name IS NULL
                     OR email = '' OR name = ''
-                """))
+                    LIMIT :batch_size
+                """)
                 
-                records_to_fix = result.fetchall()
-                
-                if not records_to_fix:
-                    print("✅ No records need fixing")
-                    return True
-                
-                print(f"📝 Found {len(records_to_fix)} records that need fixing")
-                
-                # Update records with proper default values
-                for record in records_to_fix:
-                    record_id = record[0]
-                    current_email = record[1]
-                    current_name = record[2]
+                # Build the statement once; every chunk reuses it (and its
+                # cached compiled form)
+                total_fixed = 0
+                while True:
+                    result = conn.execute(fix_batch, {'batch_size': FIX_BATCH_SIZE})
                     
-                    # Set better default values
-                    new_email = current_email if current_email and current_email != 'unknown@example.com' else f'legacy_user_{record_id}@lawvriksh.com'
-                    new_name = current_name if current_name and current_name != 'Unknown User' else f'Legacy User {record_id}'
+                    # Commit each chunk
+                    trans.commit()
+                    total_fixed += result.rowcount
                     
-                    conn.execute(text("""
-                        UPDATE feedback 
-                        SET email = :email, name = :name 
-                        WHERE id = :id
-                    """), {
-                        'email': new_email,
-                        'name': new_name,
-                        'id': record_id
-                    })
+                    if result.rowcount < FIX_BATCH_SIZE:
+                        break
                     
-                    print(f"   ✅ Fixed record {record_id}: {new_name} ({new_email})")
+                    trans = conn.begin()
+                
+                if not total_fixed:
+                    print("✅ No records need fixing")
+                    return True
                 
-                # Commit transaction
-                trans.commit()
+                print(f"📝 Fixed {total_fixed} records")
                 print("✅ All existing records fixed successfully!")
                 
                 # Verify the fix
@@ -7,22 +7,86 @@ This script diagnoses and fixes the instant welcome email issue for Sahil.
 """
 
 import logging
+import smtplib
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+
+from app.core.config import settings
+from app.services.email_campaign_service import (
+    EMAIL_TEMPLATES,
+    render_campaign_template,
+    send_welcome_email_campaign,
+)
+from script_helpers import run_test
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class SharedSMTPConnection:
+    """SMTP session opened on first use and reused for every test email."""
+    
+    def __init__(self):
+        self.server = None
+        # The diagnostic tests run concurrently, so serialize use of the session
+        self.lock = threading.Lock()
+    
+    def connect(self):
+        """Open and authenticate the SMTP session."""
+        server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
+        server.starttls()
+        if settings.SMTP_USER and settings.SMTP_PASSWORD:
+            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        self.server = server
+        return server
+    
+    def send(self, user_email: str, subject: str, body: str):
+        """Send an email over the shared session, connecting if needed."""
+        msg = MIMEText(body)
+        msg["Subject"] = subject
+        msg["From"] = settings.EMAIL_FROM
+        msg["To"] = user_email
+        
+        with self.lock:
+            if self.server is None:
+                server = self.connect()
+            else:
+                # Reset the previous transaction instead of reconnecting; some
+                # servers hang up on RSET, in which case open a fresh session
+                server = self.server
+                try:
+                    server.rset()
+                except smtplib.SMTPServerDisconnected:
+                    server = self.connect()
+            
+            server.sendmail(settings.EMAIL_FROM, [user_email], msg.as_string())
+        
+        logger.info(f"Email sent successfully to {user_email}")
+    
+    def close(self):
+        """Close the shared session if it was opened."""
+        with self.lock:
+            if self.server is None:
+                return
+            try:
+                self.server.quit()
+            except smtplib.SMTPException:
+                self.server.close()
+            self.server = None
+
+smtp_connection = SharedSMTPConnection()
+
 def test_email_service():
     """Test the basic email service."""
     try:
         logger.info("🔧 Testing Basic Email Service")
-        from app.services.email_service import send_email
         
         subject = "Test Email from LawVriksh"
         body = "This is a test email to verify SMTP is working."
         
-        send_email("sahilsaurav2507@gmail.com", subject, body)
+        smtp_connection.send("sahilsaurav2507@gmail.com", subject, body)
         logger.info("✅ Basic email service working!")
         return True
         
@@ -35,7 +99,6 @@ def test_welcome_email_campaign():
     """Test the welcome email campaign."""
     try:
         logger.info("📧 Testing Welcome Email Campaign")
-        from app.services.email_campaign_service import send_welcome_email_campaign
         
         result = send_welcome_email_campaign("sahilsaurav2507@gmail.com", "Sahil Saurav")
         
@@ -55,11 +118,10 @@ def test_email_template():
     """Test the email template rendering."""
     try:
         logger.info("📝 Testing Email Template")
-        from app.services.email_campaign_service import EMAIL_TEMPLATES
         
         template = EMAIL_TEMPLATES["welcome"]
         subject = template["subject"]
-        body = template["template"].format(name="Sahil Saurav")
+        body = render_campaign_template("welcome", "Sahil Saurav")
         
         logger.info(f"✅ Template rendered successfully!")
         logger.info(f"Subject: {subject}")
@@ -76,7 +138,6 @@ def send_direct_welcome_email():
     """Send welcome email directly using basic email service."""
     try:
         logger.info("📤 Sending Direct Welcome Email to Sahil")
-        from app.services.email_service import send_email
         
         subject = "✨ Welcome Aboard, LawVriksh Founding Member!"
         body = """
@@ -98,7 +159,7 @@ The LawVriksh Team
 📧 Contact: info@lawvriksh.com
         """
         
-        send_email("sahilsaurav2507@gmail.com", subject, body)
+        smtp_connection.send("sahilsaurav2507@gmail.com", subject, body)
         logger.info("✅ Direct welcome email sent to Sahil!")
         return True
         
@@ -111,7 +172,6 @@ def test_smtp_configuration():
     """Test SMTP configuration."""
     try:
         logger.info("🔌 Testing SMTP Configuration")
-        from app.core.config import settings
         
         logger.info(f"EMAIL_FROM: {settings.EMAIL_FROM}")
         logger.info(f"SMTP_HOST: {settings.SMTP_HOST}")
@@ -141,7 +201,6 @@ def fix_registration_email():
         
         # Test the exact code from auth.py
         try:
-            from app.services.email_campaign_service import send_welcome_email_campaign
             result = send_welcome_email_campaign(user_email, user_name)
             
             if result:
@@ -177,19 +236,14 @@ def main():
         ("Direct Welcome Email", send_direct_welcome_email),
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        logger.info(f"\n🔄 Running: {test_name}")
-        try:
-            result = test_func()
-            results.append(result)
-            if result:
-                logger.info(f"✅ {test_name}: PASSED")
-            else:
-                logger.error(f"❌ {test_name}: FAILED")
-        except Exception as e:
-            logger.error(f"❌ {test_name}: FAILED with exception: {e}")
-            results.append(False)
+    # The configuration check runs first; the remaining tests are independent
+    # of each other and mostly wait on SMTP, so run them concurrently
+    results = [run_test(*tests[0])]
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results.extend(executor.map(lambda test: run_test(*test), tests[1:]))
+    finally:
+        smtp_connection.close()
     
     # Final results
     passed = sum(results)
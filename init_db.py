@@ -17,18 +17,29 @@ def init_database():
     print("🔄 Initializing database...")
     
     try:
+        from sqlalchemy import inspect
         from app.core.dependencies import engine
         from app.core.database import Base
         
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created successfully")
-        
-        # Import all models to ensure they're registered
-        from app.models import user, share  # This ensures all models are loaded
+        # Import all models to ensure they're registered before creating tables
+        from app.models import user, share, feedback  # This ensures all models are loaded
         
         print("✅ All models loaded successfully")
         
+        # Introspect the existing tables once, then create only the missing
+        # ones without create_all's per-table existence checks
+        existing_tables = set(inspect(engine).get_table_names())
+        missing_tables = [
+            table for table in Base.metadata.sorted_tables
+            if table.name not in existing_tables
+        ]
+        
+        if missing_tables:
+            Base.metadata.create_all(bind=engine, tables=missing_tables, checkfirst=False)
+            print(f"✅ Database tables created successfully: {', '.join(t.name for t in missing_tables)}")
+        else:
+            print("✅ Database tables already exist")
+        
     except Exception as e:
         print(f"❌ Error initializing database: {e}")
         return False
@@ -40,36 +51,47 @@ def create_admin_user():
     print("🔄 Creating admin user...")
     
     try:
+        from sqlalchemy import insert
         from app.core.dependencies import get_db
         from app.models.user import User
-        from passlib.context import CryptContext
         
         # Get database session
         db = next(get_db())
         
-        # Check if admin user already exists
+        # Check if admin user already exists (only the id is needed)
         admin_email = "admin@lawvriksh.com"
-        existing_admin = db.query(User).filter(User.email == admin_email).first()
+        existing_admin_id = db.query(User.id).filter(User.email == admin_email).scalar()
         
-        if existing_admin:
+        if existing_admin_id is not None:
             print(f"ℹ️  Admin user already exists: {admin_email}")
             return True
         
+        # Only load passlib and pay for the bcrypt hash when the admin is missing
+        from passlib.context import CryptContext
+        
         # Create password context
         pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         
-        # Create admin user
-        admin_user = User(
-            name="Admin User",
-            email=admin_email,
-            password_hash=pwd_context.hash("admin123"),  # Change this password!
-            is_admin=True,
-            is_active=True
+        # Create admin user with a single Core INSERT; nothing reads the row
+        # back, so skip the ORM unit of work and the post-insert refresh.
+        # IGNORE makes a concurrent run a no-op instead of a duplicate-key error
+        result = db.execute(
+            insert(User)
+            .values(
+                name="Admin User",
+                email=admin_email,
+                password_hash=pwd_context.hash("admin123"),  # Change this password!
+                is_admin=True,
+                is_active=True
+            )
+            .prefix_with("IGNORE", dialect="mysql")
         )
-        
-        db.add(admin_user)
         db.commit()
-        db.refresh(admin_user)
+        
+        if not result.rowcount:
+            print(f"ℹ️  Admin user already exists: {admin_email}")
+            db.close()
+            return True
         
         print(f"✅ Admin user created successfully!")
         print(f"   Email: {admin_email}")
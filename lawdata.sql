@@ -56,7 +56,9 @@ CREATE TABLE users (
     INDEX idx_users_total_points (total_points DESC),
     INDEX idx_users_current_rank (current_rank),
     INDEX idx_users_default_rank (default_rank),
-    INDEX idx_users_is_admin (is_admin)
+    INDEX idx_users_is_admin (is_admin),
+    INDEX idx_users_is_admin_created_at (is_admin, created_at),
+    INDEX idx_users_is_admin_current_rank (is_admin, current_rank)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- =====================================================
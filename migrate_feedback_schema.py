@@ -33,70 +33,52 @@ def migrate_database():
             trans = conn.begin()
             
             try:
+                existing_columns = {col['name'] for col in inspect(engine).get_columns('feedback')}
+                
+                # Collect every change into one ALTER TABLE so the table is
+                # rebuilt once; ALGORITHM=INPLACE, LOCK=NONE avoids a table
+                # copy and keeps feedback writable while the migration runs
+                alterations = []
+                
                 # Check if email column already exists
-                if not check_column_exists(engine, 'feedback', 'email'):
-                    print("📝 Adding email column...")
-                    conn.execute(text("""
-                        ALTER TABLE feedback 
-                        ADD COLUMN email VARCHAR(255) NOT NULL DEFAULT 'unknown@example.com'
-                    """))
-                    
-                    # Create index for email
-                    print("📝 Creating email index...")
-                    conn.execute(text("""
-                        CREATE INDEX ix_feedback_email ON feedback (email)
-                    """))
+                if 'email' not in existing_columns:
+                    print("📝 Adding email column and index...")
+                    alterations.append("ADD COLUMN email VARCHAR(255) NOT NULL DEFAULT 'unknown@example.com'")
+                    alterations.append("ADD INDEX ix_feedback_email (email)")
                 else:
                     print("✅ Email column already exists")
                 
                 # Check if name column already exists
-                if not check_column_exists(engine, 'feedback', 'name'):
+                if 'name' not in existing_columns:
                     print("📝 Adding name column...")
-                    conn.execute(text("""
-                        ALTER TABLE feedback 
-                        ADD COLUMN name VARCHAR(255) NOT NULL DEFAULT 'Unknown User'
-                    """))
+                    alterations.append("ADD COLUMN name VARCHAR(255) NOT NULL DEFAULT 'Unknown User'")
                 else:
                     print("✅ Name column already exists")
                 
-                # Make primary_motivation nullable
-                print("📝 Making primary_motivation nullable...")
-                conn.execute(text("""
-                    ALTER TABLE feedback 
-                    MODIFY COLUMN primary_motivation ENUM('A', 'B', 'C', 'D') NULL
-                """))
-                
-                # Make time_consuming_part nullable
-                print("📝 Making time_consuming_part nullable...")
-                conn.execute(text("""
-                    ALTER TABLE feedback 
-                    MODIFY COLUMN time_consuming_part ENUM('A', 'B', 'C', 'D') NULL
-                """))
-                
-                # Make monetization_considerations nullable
-                print("📝 Making monetization_considerations nullable...")
-                conn.execute(text("""
-                    ALTER TABLE feedback 
-                    MODIFY COLUMN monetization_considerations TEXT NULL
-                """))
-                
-                # Make professional_legacy nullable
-                print("📝 Making professional_legacy nullable...")
-                conn.execute(text("""
-                    ALTER TABLE feedback 
-                    MODIFY COLUMN professional_legacy TEXT NULL
-                """))
-                
-                # Remove default values from new columns
+                # Make the optional survey fields nullable
+                print("📝 Making primary_motivation, time_consuming_part, monetization_considerations and professional_legacy nullable...")
+                alterations.extend([
+                    "MODIFY COLUMN primary_motivation ENUM('A', 'B', 'C', 'D') NULL",
+                    "MODIFY COLUMN time_consuming_part ENUM('A', 'B', 'C', 'D') NULL",
+                    "MODIFY COLUMN monetization_considerations TEXT NULL",
+                    "MODIFY COLUMN professional_legacy TEXT NULL",
+                ])
+                
+                conn.execute(text(
+                    "ALTER TABLE feedback "
+                    + ", ".join(alterations)
+                    + ", ALGORITHM=INPLACE, LOCK=NONE"
+                ))
+                
+                # Remove default values from new columns; MySQL cannot alter a
+                # column added in the same statement, so this stays separate
+                # (it only touches table metadata)
                 print("📝 Removing default values...")
                 conn.execute(text("""
                     ALTER TABLE feedback 
-                    ALTER COLUMN email DROP DEFAULT
-                """))
-                
-                conn.execute(text("""
-                    ALTER TABLE feedback 
-                    ALTER COLUMN name DROP DEFAULT
+                    ALTER COLUMN email DROP DEFAULT,
+                    ALTER COLUMN name DROP DEFAULT,
+                    ALGORITHM=INPLACE, LOCK=NONE
                 """))
                 
                 # Commit transaction
@@ -105,9 +87,8 @@ def migrate_database():
                 
                 # Show updated schema
                 print("\n📊 Updated feedback table schema:")
-                result = conn.execute(text("DESCRIBE feedback"))
-                for row in result:
-                    print(f"   - {row[0]} ({row[1]}) {'NULL' if row[2] == 'YES' else 'NOT NULL'}")
+                for col in inspect(engine).get_columns('feedback'):
+                    print(f"   - {col['name']} ({col['type']}) {'NULL' if col['nullable'] else 'NOT NULL'}")
                 
             except Exception as e:
                 trans.rollback()
@@ -13,7 +13,7 @@ Usage:
 """
 
 import logging
-from sqlalchemy import text
+from sqlalchemy import select, text
 from app.core.dependencies import get_db
 from app.models.user import User
 from app.services.ranking_service import assign_default_rank, update_all_ranks
@@ -22,6 +22,14 @@ from app.services.ranking_service import assign_default_rank, update_all_ranks
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# (is_admin, created_at) lets migrate_existing_users read users in
+# registration order without a filesort; (is_admin, current_rank) serves
+# leaderboard reads ordered by rank
+COMPOSITE_INDEXES = {
+    'idx_users_is_admin_created_at': 'is_admin, created_at',
+    'idx_users_is_admin_current_rank': 'is_admin, current_rank',
+}
+
 def check_columns_exist(db):
     """Check if the new rank columns already exist."""
     try:
@@ -67,25 +75,61 @@ def add_rank_columns(db):
         db.rollback()
         return False
 
+def add_composite_indexes(db):
+    """Create the composite users indexes declared on User that are missing."""
+    try:
+        existing = {row[0] for row in db.execute(text("""
+            SELECT DISTINCT INDEX_NAME
+            FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = 'users'
+        """)).fetchall()}
+        
+        for name, columns in COMPOSITE_INDEXES.items():
+            if name in existing:
+                logger.info(f"Index {name} already exists")
+                continue
+            db.execute(text(f"CREATE INDEX {name} ON users ({columns})"))
+            logger.info(f"✅ Created index {name}")
+        
+        db.commit()
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Error adding composite indexes: {e}")
+        db.rollback()
+        return False
+
 def migrate_existing_users(db):
     """Migrate existing users to the new ranking system."""
     try:
         logger.info("Migrating existing users to new ranking system...")
         
-        # Get all non-admin users ordered by creation date
-        users = db.query(User).filter(
-            User.is_admin == False
-        ).order_by(User.created_at.asc()).all()
+        # Get the IDs of all non-admin users ordered by creation date; only the
+        # ordering is needed, so skip hydrating full User objects
+        user_ids = db.execute(
+            select(User.id).where(User.is_admin == False).order_by(User.created_at.asc())
+        ).scalars().all()
         
-        logger.info(f"Found {len(users)} users to migrate")
+        logger.info(f"Found {len(user_ids)} users to migrate")
         
-        # Assign default ranks based on registration order
-        for rank, user in enumerate(users, 1):
-            user.default_rank = rank
-            logger.info(f"Assigned default rank {rank} to user {user.id} ({user.name})")
+        # Assign default ranks based on registration order, writing them
+        # with one executemany UPDATE
+        # Per-user detail is only logged at DEBUG; check the level once
+        # rather than paying for a logging call on every iteration
+        log_each_rank = logger.isEnabledFor(logging.DEBUG)
+        mappings = []
+        for rank, user_id in enumerate(user_ids, 1):
+            mappings.append({'id': user_id, 'default_rank': rank})
+            if log_each_rank:
+                logger.debug("Assigned default rank %d to user %d", rank, user_id)
         
+        if mappings:
+            db.execute(text("""
+                UPDATE users SET default_rank = :default_rank WHERE id = :id
+            """), mappings)
         db.commit()
-        logger.info("✅ Default ranks assigned")
+        logger.info("✅ Assigned %d default ranks", len(mappings))
         
         # Update current ranks based on points
         logger.info("Calculating current ranks based on points...")
@@ -104,16 +148,16 @@ def verify_migration(db):
     try:
         logger.info("Verifying migration...")
         
-        # Check that all users have ranks assigned
-        users_without_default_rank = db.query(User).filter(
-            User.is_admin == False,
-            User.default_rank.is_(None)
-        ).count()
+        # Check that all users have ranks assigned (both counts in one query)
+        stats = db.execute(text("""
+            SELECT COUNT(CASE WHEN default_rank IS NULL THEN 1 END) as without_default_rank,
+                   COUNT(CASE WHEN current_rank IS NULL THEN 1 END) as without_current_rank
+            FROM users
+            WHERE is_admin = FALSE
+        """)).first()
         
-        users_without_current_rank = db.query(User).filter(
-            User.is_admin == False,
-            User.current_rank.is_(None)
-        ).count()
+        users_without_default_rank = stats[0]
+        users_without_current_rank = stats[1]
         
         if users_without_default_rank > 0:
             logger.warning(f"⚠️  {users_without_default_rank} users without default rank")
@@ -167,6 +211,13 @@ def main():
             else:
                 logger.info("Step 2: Skipped - columns already exist")
         
+        # Added separately from the columns so databases that already had the
+        # rank columns still get them
+        logger.info("Adding composite indexes...")
+        if not add_composite_indexes(db):
+            logger.error("❌ Failed to add composite indexes")
+            return False
+        
         # Step 3: Migrate existing users
         logger.info("Step 3: Migrating existing users...")
         if not migrate_existing_users(db):
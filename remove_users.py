@@ -12,47 +12,61 @@ from pathlib import Path
 # Add the app directory to Python path
 sys.path.append(str(Path(__file__).parent))
 
-from app.core.dependencies import get_db
+from sqlalchemy import delete, select
+from app.core.dependencies import engine
 from app.models.user import User
-from app.models.share import ShareEvent
+from app.models import feedback, share  # Register models referenced by User relationships
 
-def remove_user(db, email):
-    """Remove a user and their associated data."""
+def remove_users(emails):
+    """Remove the given users and their associated data in one transaction.
+    
+    Returns the number of users removed.
+    """
     try:
-        # Find the user
-        user = db.query(User).filter(User.email == email).first()
-        
-        if not user:
-            print(f"❌ User {email} not found")
-            return False
-        
-        print(f"📋 Found user: {user.name} (ID: {user.id})")
-        print(f"   Email: {user.email}")
-        print(f"   Created: {user.created_at}")
-        print(f"   Points: {user.total_points}")
-        print(f"   Shares: {user.shares_count}")
-        
-        # Check for associated share events
-        share_events = db.query(ShareEvent).filter(ShareEvent.user_id == user.id).all()
-        if share_events:
-            print(f"   📊 Found {len(share_events)} share events to delete")
+        # A one-shot admin operation needs no ORM session: run Core
+        # statements on a pooled connection inside a single transaction
+        with engine.begin() as conn:
+            # Find all the users in one query, selecting only the columns
+            # that are reported
+            users = conn.execute(
+                select(
+                    User.id, User.name, User.email, User.created_at, User.total_points, User.shares_count
+                ).where(User.email.in_(emails))
+            ).all()
+            users_by_email = {user.email: user for user in users}
             
-            # Delete share events first (foreign key constraint)
-            for share in share_events:
-                db.delete(share)
-            print(f"   ✅ Deleted {len(share_events)} share events")
-        
-        # Delete the user
-        db.delete(user)
-        db.commit()
+            # Build each user's report and write it in one call rather than
+            # one print() per line
+            for email in emails:
+                msgs = [f"🔄 Processing: {email}"]
+                user = users_by_email.get(email)
+                
+                if not user:
+                    msgs.append(f"❌ User {email} not found")
+                else:
+                    msgs.extend([
+                        f"📋 Found user: {user.name} (ID: {user.id})",
+                        f"   Email: {user.email}",
+                        f"   Created: {user.created_at}",
+                        f"   Points: {user.total_points}",
+                        f"   Shares: {user.shares_count}",
+                    ])
+                msgs.append("")
+                sys.stdout.write("\n".join(msgs) + "\n")
+            
+            if not users:
+                return 0
+            
+            # Delete the users; their share events go with them via the
+            # share_events.user_id ON DELETE CASCADE foreign key
+            conn.execute(delete(User).where(User.id.in_([user.id for user in users])))
         
-        print(f"✅ Successfully removed user: {email}")
-        return True
+        sys.stdout.write("".join(f"✅ Successfully removed user: {user.email}\n" for user in users))
+        return len(users)
         
     except Exception as e:
-        db.rollback()
-        print(f"❌ Error removing user {email}: {e}")
-        return False
+        print(f"❌ Error removing users: {e}")
+        return 0
 
 def main():
     """Remove the specified users."""
@@ -66,38 +80,31 @@ def main():
         "prabhjotjaswal11@gmail.com"
     ]
     
-    db = next(get_db())
-    
     try:
         print(f"📋 Users to remove: {len(users_to_remove)}")
         print()
         
-        removed_count = 0
-        
-        for email in users_to_remove:
-            print(f"🔄 Processing: {email}")
-            if remove_user(db, email):
-                removed_count += 1
-            print()
+        removed_count = remove_users(users_to_remove)
         
-        print("=" * 50)
-        print(f"📊 SUMMARY:")
-        print(f"   Total users processed: {len(users_to_remove)}")
-        print(f"   Successfully removed: {removed_count}")
-        print(f"   Failed to remove: {len(users_to_remove) - removed_count}")
+        summary = [
+            "",
+            "=" * 50,
+            "📊 SUMMARY:",
+            f"   Total users processed: {len(users_to_remove)}",
+            f"   Successfully removed: {removed_count}",
+            f"   Failed to remove: {len(users_to_remove) - removed_count}",
+        ]
         
         if removed_count == len(users_to_remove):
-            print("🎉 All users removed successfully!")
+            summary.append("🎉 All users removed successfully!")
         elif removed_count > 0:
-            print("⚠️  Some users were removed, but some failed.")
+            summary.append("⚠️  Some users were removed, but some failed.")
         else:
-            print("❌ No users were removed.")
+            summary.append("❌ No users were removed.")
+        sys.stdout.write("\n".join(summary) + "\n")
             
     except Exception as e:
         print(f"❌ Script error: {e}")
-        db.rollback()
-    finally:
-        db.close()
 
 if __name__ == "__main__":
     main()
@@ -23,14 +23,23 @@ Usage:
 """
 
 import argparse
+import asyncio
 import logging
 import json
-import subprocess
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any, List
 
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +47,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Recommendation for a failed suite, keyed by a word in its name; the first
+# matching keyword wins
+FAILURE_RECOMMENDATIONS = {
+    "registration": "Check database connectivity and user service configuration",
+    "email": "Verify SMTP configuration and Celery worker status",
+    "api": "Review API endpoints and authentication configuration",
+}
+
+# Bytes copied per read from a subprocess pipe
+DRAIN_CHUNK_SIZE = 65536
+
+async def _drain_stream(stream: asyncio.StreamReader, log_path: Path):
+    """Copy a subprocess stream into a log file in fixed-size chunks.
+
+    Chunked reads have no line-length limit, so a child printing one very
+    long line (a JSON dump, say) can't stall the copy.
+    """
+    with open(log_path, "wb") as log_file:
+        while True:
+            chunk = await stream.read(DRAIN_CHUNK_SIZE)
+            if not chunk:
+                break
+            log_file.write(chunk)
+
 class SahilCompleteTestRunner:
     """Master test runner for Sahil's complete registration flow."""
     
@@ -47,13 +80,19 @@ class SahilCompleteTestRunner:
         self.test_results = {}
         self.start_time = datetime.now()
         
+        # Keep-alive session so repeated API probes reuse one connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         self.test_user = {
             "name": "Sahil Saurav",
             "email": "sahilsaurav2507@gmail.com",
             "password": "SecurePassword123!"
         }
     
-    def run_subprocess_test(self, script_name: str, args: List[str] = None) -> Dict[str, Any]:
+    async def run_subprocess_test(self, script_name: str, args: List[str] = None) -> Dict[str, Any]:
         """Run a test script as subprocess and capture results."""
         cmd = [sys.executable, script_name]
         if args:
@@ -61,94 +100,120 @@ class SahilCompleteTestRunner:
         
         logger.info(f"🔄 Running: {script_name}")
         
+        # Output goes straight to log files; results carry only their paths
+        log_prefix = f"{Path(script_name).stem}.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        stdout_log = Path(f"{log_prefix}.stdout.log")
+        stderr_log = Path(f"{log_prefix}.stderr.log")
+        
         try:
             start_time = time.time()
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        _drain_stream(process.stdout, stdout_log),
+                        _drain_stream(process.stderr, stderr_log),
+                        process.wait()
+                    ),
+                    timeout=300  # 5 minute timeout
+                )
+            except asyncio.TimeoutError:
+                return {
+                    "script": script_name,
+                    "success": False,
+                    "return_code": -1,
+                    "execution_time": 300,
+                    "stdout_log": str(stdout_log),
+                    "stderr_log": str(stderr_log),
+                    "error": "Test timed out after 5 minutes"
+                }
+            finally:
+                # On a timeout or a failed copy the child may still be running
+                # with nobody reading its pipes, so stop it
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
             end_time = time.time()
             
             execution_time = end_time - start_time
-            success = result.returncode == 0
+            success = process.returncode == 0
             
             return {
                 "script": script_name,
                 "success": success,
-                "return_code": result.returncode,
+                "return_code": process.returncode,
                 "execution_time": execution_time,
-                "stdout": result.stdout,
-                "stderr": result.stderr
+                "stdout_log": str(stdout_log),
+                "stderr_log": str(stderr_log)
             }
             
-        except subprocess.TimeoutExpired:
-            return {
-                "script": script_name,
-                "success": False,
-                "return_code": -1,
-                "execution_time": 300,
-                "stdout": "",
-                "stderr": "Test timed out after 5 minutes"
-            }
         except Exception as e:
             return {
                 "script": script_name,
                 "success": False,
                 "return_code": -1,
                 "execution_time": 0,
-                "stdout": "",
-                "stderr": str(e)
+                "error": str(e)
             }
     
-    def run_registration_flow_test(self) -> Dict[str, Any]:
+    async def run_registration_flow_test(self) -> Dict[str, Any]:
         """Run the main registration flow test."""
         logger.info("🚀 Running Sahil Registration Flow Test")
         
         args = ["--url", self.api_url]
-        result = self.run_subprocess_test("test_sahil_registration_flow.py", args)
+        result = await self.run_subprocess_test("test_sahil_registration_flow.py", args)
         
         # Log results
         if result["success"]:
             logger.info("✅ Registration Flow Test: PASSED")
         else:
             logger.error("❌ Registration Flow Test: FAILED")
-            if result["stderr"]:
-                logger.error(f"Error: {result['stderr']}")
+            if result.get("error"):
+                logger.error(f"Error: {result['error']}")
+            if result.get("stderr_log"):
+                logger.error(f"See {result['stderr_log']} for the script's error output")
         
         return result
     
-    def run_email_background_test(self) -> Dict[str, Any]:
+    async def run_email_background_test(self) -> Dict[str, Any]:
         """Run the email and background tasks test."""
         logger.info("📧 Running Email and Background Tasks Test")
         
-        result = self.run_subprocess_test("test_email_and_background_tasks.py")
+        result = await self.run_subprocess_test("test_email_and_background_tasks.py")
         
         # Log results
         if result["success"]:
             logger.info("✅ Email and Background Tasks Test: PASSED")
         else:
             logger.error("❌ Email and Background Tasks Test: FAILED")
-            if result["stderr"]:
-                logger.error(f"Error: {result['stderr']}")
+            if result.get("error"):
+                logger.error(f"Error: {result['error']}")
+            if result.get("stderr_log"):
+                logger.error(f"See {result['stderr_log']} for the script's error output")
         
         return result
     
-    def run_api_comprehensive_test(self) -> Dict[str, Any]:
+    async def run_api_comprehensive_test(self) -> Dict[str, Any]:
         """Run the comprehensive API test suite."""
         logger.info("🔧 Running Comprehensive API Test")
         
         args = ["--url", self.api_url]
-        result = self.run_subprocess_test("test_all_apis.py", args)
+        result = await self.run_subprocess_test("test_all_apis.py", args)
         
         # Log results
         if result["success"]:
             logger.info("✅ Comprehensive API Test: PASSED")
         else:
             logger.error("❌ Comprehensive API Test: FAILED")
-            if result["stderr"]:
-                logger.error(f"Error: {result['stderr']}")
+            if result.get("error"):
+                logger.error(f"Error: {result['error']}")
+            if result.get("stderr_log"):
+                logger.error(f"See {result['stderr_log']} for the script's error output")
         
         return result
     
@@ -163,13 +228,7 @@ class SahilCompleteTestRunner:
             "test_all_apis.py"
         ]
         
-        missing_files = []
-        for file in required_files:
-            try:
-                with open(file, 'r'):
-                    pass
-            except FileNotFoundError:
-                missing_files.append(file)
+        missing_files = [file for file in required_files if not Path(file).is_file()]
         
         if missing_files:
             logger.error(f"❌ Missing test files: {missing_files}")
@@ -179,8 +238,7 @@ class SahilCompleteTestRunner:
         
         # Test API connectivity
         try:
-            import requests
-            response = requests.get(f"{self.api_url}/health", timeout=10)
+            response = self.session.get(f"{self.api_url}/health", timeout=10)
             if response.status_code == 200:
                 logger.info("✅ API is accessible")
                 return True
@@ -227,12 +285,11 @@ class SahilCompleteTestRunner:
         # Check individual test results
         for test_name, result in self.test_results.items():
             if not result["success"]:
-                if "registration" in test_name.lower():
-                    recommendations.append("Check database connectivity and user service configuration")
-                elif "email" in test_name.lower():
-                    recommendations.append("Verify SMTP configuration and Celery worker status")
-                elif "api" in test_name.lower():
-                    recommendations.append("Review API endpoints and authentication configuration")
+                name_lower = test_name.lower()
+                for keyword, recommendation in FAILURE_RECOMMENDATIONS.items():
+                    if keyword in name_lower:
+                        recommendations.append(recommendation)
+                        break
         
         # General recommendations
         if len(recommendations) == 0:
@@ -243,7 +300,7 @@ class SahilCompleteTestRunner:
         
         return recommendations
     
-    def run_complete_test_suite(self) -> Dict[str, Any]:
+    async def run_complete_test_suite(self) -> Dict[str, Any]:
         """Run the complete test suite for Sahil's registration flow."""
         logger.info("🎯 SAHIL SAURAV COMPLETE TEST SUITE")
         logger.info("=" * 70)
@@ -265,18 +322,18 @@ class SahilCompleteTestRunner:
             ("Comprehensive API Test", self.run_api_comprehensive_test),
         ]
         
+        # Run the suites one at a time: they all register and email the same
+        # Sahil account and share the API's per-IP rate limit, so running them
+        # together would make each one's results depend on the others
         for test_name, test_function in test_sequence:
             logger.info(f"\n{'='*20} {test_name} {'='*20}")
             try:
-                result = test_function()
+                result = await test_function()
                 self.test_results[test_name] = result
                 
                 # Brief summary
                 status = "✅ PASSED" if result["success"] else "❌ FAILED"
                 logger.info(f"{status} - Execution Time: {result['execution_time']:.2f}s")
-                
-                time.sleep(2)  # Brief pause between major test suites
-                
             except Exception as e:
                 logger.error(f"❌ {test_name} failed with exception: {e}")
                 self.test_results[test_name] = {
@@ -318,8 +375,12 @@ class SahilCompleteTestRunner:
         
         # Save comprehensive report
         report_filename = f"sahil_complete_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_filename, "w") as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(report_filename, "wb") as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_filename, "w") as f:
+                json.dump(report, f, indent=2)
         
         logger.info(f"📄 Detailed report saved to: {report_filename}")
         
@@ -334,7 +395,10 @@ def main():
     
     # Run the complete test suite
     test_runner = SahilCompleteTestRunner(args.url, args.production)
-    report = test_runner.run_complete_test_suite()
+    try:
+        report = asyncio.run(test_runner.run_complete_test_suite())
+    finally:
+        test_runner.session.close()
     
     # Exit with appropriate code
     if "error" in report:
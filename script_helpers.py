@@ -0,0 +1,140 @@
+"""
+Helpers shared by the standalone test and diagnostic scripts.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import jwt
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Retry dropped connections and gateway errors with a short backoff. Only the
+# idempotent reads are retried after a response, so a signup, share or
+# campaign email that reached the server is never sent twice
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD"])
+)
+
+def pooled_session():
+    """Return a keep-alive session whose connection pool retries with RETRY."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+def parse_json(response):
+    """Parse a response body as JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Admin JWT shared across runs and scripts, keyed by API base URL, until it is
+# about to expire
+ADMIN_TOKEN_CACHE = Path.home() / ".cache" / "lawvriksh_admin_token.json"
+
+def load_cached_admin_token(base_url):
+    """Return the cached admin token for base_url if it is valid for at least another minute."""
+    try:
+        cached = json.loads(ADMIN_TOKEN_CACHE.read_text())
+        if cached["base_url"] != base_url:
+            return None
+        admin_token = cached["access_token"]
+        expires_at = jwt.decode(admin_token, options={"verify_signature": False})["exp"]
+    except (OSError, ValueError, KeyError, jwt.PyJWTError):
+        return None
+    
+    return admin_token if expires_at > time.time() + 60 else None
+
+def cache_admin_token(base_url, admin_token):
+    """Save the admin token for later runs, readable by the current user only."""
+    try:
+        ADMIN_TOKEN_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(ADMIN_TOKEN_CACHE, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump({"base_url": base_url, "access_token": admin_token}, cache_file)
+    except OSError as e:
+        logger.warning(f"⚠️  Could not cache admin token: {e}")
+
+class AdminAuth(AuthBase):
+    """Bearer auth with an admin token that is cached across runs.
+
+    The token starts out as the cached one for base_url, if any; call login()
+    when token_from_cache is False. If the server rejects a cached token with
+    401 (e.g. its secret key changed), logs in again once and resends the
+    request with the new token.
+    """
+
+    def __init__(self, session, base_url, email, password):
+        self.session = session
+        self.base_url = base_url
+        self.credentials = {"email": email, "password": password}
+        self.token = load_cached_admin_token(base_url)
+        self.token_from_cache = self.token is not None
+
+    def login(self):
+        """Log in as admin and cache the new token; return False on failure."""
+        # Cleared first so a 401 from the login itself is never retried
+        self.token_from_cache = False
+        response = self.session.post(f"{self.base_url}/auth/login", json=self.credentials)
+        if response.status_code != 200:
+            logger.error(f"❌ Admin login failed: {response.status_code} {response.text}")
+            return False
+
+        self.token = parse_json(response)["access_token"]
+        cache_admin_token(self.base_url, self.token)
+        return True
+
+    def __call__(self, request):
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        request.register_hook("response", self._login_again_on_401)
+        return request
+
+    def _login_again_on_401(self, response, **kwargs):
+        if response.status_code != 401 or not self.token_from_cache:
+            return response
+
+        logger.info("🔄 Cached admin token was rejected, logging in again")
+        if not self.login():
+            return response
+
+        # Release the connection before resending, as requests' own auth retries do
+        response.content
+        response.close()
+        retry = response.request.copy()
+        retry.headers["Authorization"] = f"Bearer {self.token}"
+        retried = response.connection.send(retry, **kwargs)
+        retried.history.append(response)
+        retried.request = retry
+        return retried
+
+def run_test(test_name, test_func):
+    """Run a single test and log its outcome; an exception counts as a failure."""
+    logger.info(f"\n🔄 Running: {test_name}")
+    try:
+        result = test_func()
+        if result:
+            logger.info(f"✅ {test_name}: PASSED")
+        else:
+            logger.error(f"❌ {test_name}: FAILED")
+        return result
+    except Exception as e:
+        logger.error(f"❌ {test_name}: FAILED with exception: {e}")
+        return False
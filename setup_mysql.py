@@ -5,7 +5,9 @@ This script helps you set up and test MySQL database connection.
 """
 
 import sys
-import os
+import re
+import fileinput
+import subprocess
 from pathlib import Path
 import getpass
 
@@ -13,6 +15,17 @@ import getpass
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
+# Allowed characters for database and user names, which are inlined into DDL
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+
+# Connection pool settings written to .env alongside DATABASE_URL
+POOL_SETTINGS = {
+    "DB_POOL_SIZE": 20,
+    "DB_MAX_OVERFLOW": 10,
+    "DB_POOL_RECYCLE": 1800,
+    "DB_POOL_PRE_PING": True,
+}
+
 def test_mysql_availability():
     """Test if MySQL server is available."""
     print("🔄 Testing MySQL server availability...")
@@ -22,18 +35,23 @@ def test_mysql_availability():
         print("✅ PyMySQL library is available")
     except ImportError:
         print("❌ PyMySQL not installed. Installing...")
-        os.system("pip install pymysql")
         try:
+            # Install with the pip belonging to this interpreter, without a shell
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", "pymysql"])
             import pymysql
             print("✅ PyMySQL installed successfully")
-        except ImportError:
+        except (subprocess.CalledProcessError, ImportError):
             print("❌ Failed to install PyMySQL")
             return False
     
     return True
 
-def test_mysql_connection(host, port, user, password, database=None):
-    """Test MySQL connection with given parameters."""
+def test_mysql_connection(host, port, user, password, database=None, show_version=True):
+    """Test MySQL connection with given parameters.
+    
+    With show_version=False only reachability is checked, using a ping
+    instead of a query round-trip.
+    """
     print(f"🔄 Testing connection to {user}@{host}:{port}" + (f"/{database}" if database else ""))
     
     try:
@@ -44,16 +62,21 @@ def test_mysql_connection(host, port, user, password, database=None):
             port=port,
             user=user,
             password=password,
-            database=database
+            database=database,
+            connect_timeout=5,  # Fail fast on an unreachable host
+            read_timeout=5
         )
         
         print("✅ MySQL connection successful")
         
-        # Test query
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT VERSION()")
-            version = cursor.fetchone()
-            print(f"✅ MySQL version: {version[0]}")
+        if show_version:
+            # Test query
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT VERSION()")
+                version = cursor.fetchone()
+                print(f"✅ MySQL version: {version[0]}")
+        else:
+            connection.ping(reconnect=False)
         
         connection.close()
         return True
@@ -66,30 +89,43 @@ def create_database_and_user(host, port, admin_user, admin_password, db_name, db
     """Create database and user."""
     print(f"🔄 Creating database '{db_name}' and user '{db_user}'...")
     
+    for identifier in (db_name, db_user):
+        if not IDENTIFIER_PATTERN.fullmatch(identifier):
+            print(f"❌ Invalid name '{identifier}': use only letters, digits and underscores")
+            return False
+    
     try:
         import pymysql
+        from pymysql.constants import CLIENT
         
-        # Connect as admin
+        # Connect as admin, allowing the setup statements to go in one batch
         connection = pymysql.connect(
             host=host,
             port=port,
             user=admin_user,
-            password=admin_password
+            password=admin_password,
+            client_flag=CLIENT.MULTI_STATEMENTS
+        )
+        
+        # Create database and user, grant privileges: one round-trip. The
+        # user name and password are bound as parameters; the database name
+        # is an identifier and can't be, so it was validated above
+        sql = (
+            f"CREATE DATABASE IF NOT EXISTS `{db_name}`; "
+            "CREATE USER IF NOT EXISTS %s@'localhost' IDENTIFIED BY %s; "
+            f"GRANT ALL PRIVILEGES ON `{db_name}`.* TO %s@'localhost'; "
+            "FLUSH PRIVILEGES"
         )
         
         with connection.cursor() as cursor:
-            # Create database
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
-            print(f"✅ Database '{db_name}' created/verified")
-            
-            # Create user
-            cursor.execute(f"CREATE USER IF NOT EXISTS '{db_user}'@'localhost' IDENTIFIED BY '{db_password}'")
-            print(f"✅ User '{db_user}' created/verified")
-            
-            # Grant privileges
-            cursor.execute(f"GRANT ALL PRIVILEGES ON {db_name}.* TO '{db_user}'@'localhost'")
-            cursor.execute("FLUSH PRIVILEGES")
-            print(f"✅ Privileges granted to '{db_user}' on '{db_name}'")
+            cursor.execute(sql, (db_user, db_password, db_user))
+            # Drain the remaining result sets so any statement error surfaces here
+            while cursor.nextset():
+                pass
+        
+        print(f"✅ Database '{db_name}' created/verified")
+        print(f"✅ User '{db_user}' created/verified")
+        print(f"✅ Privileges granted to '{db_user}' on '{db_name}'")
         
         connection.close()
         return True
@@ -107,29 +143,41 @@ def update_env_file(database_url):
         print("❌ .env file not found")
         return False
     
-    # Read current content
-    with open(env_file, 'r') as f:
-        lines = f.readlines()
-    
-    # Update DATABASE_URL
-    updated_lines = []
+    # Rewrite the file in a single streaming pass; print() writes to the
+    # replacement file while fileinput is active
     database_url_updated = False
+    pool_settings_present = set()
     
-    for line in lines:
-        if line.startswith('DATABASE_URL='):
-            updated_lines.append(f'DATABASE_URL={database_url}\n')
-            database_url_updated = True
-        elif line.startswith('# DATABASE_URL=mysql'):
-            updated_lines.append(f'# DATABASE_URL=sqlite:///./lawvriksh.db\n')
-        else:
-            updated_lines.append(line)
+    # Replacement for each key that needs rewriting, looked up by the text
+    # before the first '='
+    line_handlers = {
+        'DATABASE_URL': lambda line: f'DATABASE_URL={database_url}\n',
+        '# DATABASE_URL': lambda line: (
+            '# DATABASE_URL=sqlite:///./lawvriksh.db\n'
+            if line.startswith('# DATABASE_URL=mysql') else line
+        ),
+    }
     
-    if not database_url_updated:
-        updated_lines.append(f'DATABASE_URL={database_url}\n')
+    with fileinput.input(env_file, inplace=True) as f:
+        for line in f:
+            key = line.split('=', 1)[0]
+            handler = line_handlers.get(key)
+            print(handler(line) if handler else line, end='')
+            
+            if key == 'DATABASE_URL':
+                database_url_updated = True
+            elif key in POOL_SETTINGS:
+                pool_settings_present.add(key)
     
-    # Write updated content
-    with open(env_file, 'w') as f:
-        f.writelines(updated_lines)
+    # Append whatever the file didn't already define
+    new_lines = [] if database_url_updated else [f'DATABASE_URL={database_url}\n']
+    new_lines.extend(
+        f'{key}={value}\n' for key, value in POOL_SETTINGS.items()
+        if key not in pool_settings_present
+    )
+    if new_lines:
+        with open(env_file, 'a') as f:
+            f.writelines(new_lines)
     
     print("✅ .env file updated successfully")
     return True
@@ -183,7 +231,7 @@ def main():
     
     # Test connection with database user
     print(f"\n🔄 Testing connection with user '{db_user}'...")
-    if not test_mysql_connection(host, port, db_user, db_password, db_name):
+    if not test_mysql_connection(host, port, db_user, db_password, db_name, show_version=False):
         print("❌ Cannot connect with database user credentials")
         return
     
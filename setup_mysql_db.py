@@ -6,6 +6,7 @@ This script sets up the MySQL database using the lawdata.sql file.
 
 import sys
 import os
+import importlib
 import subprocess
 from pathlib import Path
 import getpass
@@ -14,19 +15,37 @@ import getpass
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-def check_mysql_client():
-    """Check if MySQL client is available."""
-    print("🔄 Checking MySQL client availability...")
+def split_sql_script(lines):
+    """Yield the statements of a mysql client script one at a time.
     
-    try:
-        result = subprocess.run(['mysql', '--version'], 
-                              capture_output=True, text=True, check=True)
-        print(f"✅ MySQL client found: {result.stdout.strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ MySQL client not found. Please install MySQL client.")
-        print("   Download from: https://dev.mysql.com/downloads/mysql/")
-        return False
+    Honors DELIMITER directives, so stored procedure and trigger bodies stay
+    whole, and skips comment lines between statements. Only the statement
+    being read is held in memory, so large dumps can be streamed from disk.
+    """
+    delimiter = ';'
+    buffer = []
+    
+    for line in lines:
+        line = line.rstrip('\r\n')
+        stripped = line.strip()
+        if not buffer and (not stripped or stripped.startswith('--')):
+            continue
+        if stripped.upper().startswith('DELIMITER '):
+            delimiter = stripped.split(None, 1)[1]
+            continue
+        
+        if stripped.endswith(delimiter):
+            buffer.append(line.rstrip()[:-len(delimiter)])
+            statement = '\n'.join(buffer).strip()
+            buffer = []
+            if statement:
+                yield statement
+        else:
+            buffer.append(line)
+    
+    trailing = '\n'.join(buffer).strip()
+    if trailing:
+        yield trailing
 
 def test_mysql_connection(host, port, user, password):
     """Test MySQL connection."""
@@ -34,6 +53,19 @@ def test_mysql_connection(host, port, user, password):
     
     try:
         import pymysql
+    except ImportError:
+        print("❌ PyMySQL not installed. Installing...")
+        try:
+            subprocess.run([sys.executable, '-m', 'pip', 'install', 'pymysql'], check=True)
+            # Make the freshly installed package visible to this process
+            importlib.invalidate_caches()
+            import pymysql
+            print("✅ PyMySQL installed successfully")
+        except (subprocess.CalledProcessError, ImportError):
+            print("❌ Failed to install PyMySQL")
+            return False
+    
+    try:
         connection = pymysql.connect(
             host=host,
             port=port,
@@ -49,21 +81,12 @@ def test_mysql_connection(host, port, user, password):
         connection.close()
         return True
         
-    except ImportError:
-        print("❌ PyMySQL not installed. Installing...")
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'pymysql'], check=True)
-            print("✅ PyMySQL installed successfully")
-            return test_mysql_connection(host, port, user, password)
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install PyMySQL")
-            return False
     except Exception as e:
         print(f"❌ MySQL connection failed: {e}")
         return False
 
 def execute_sql_file(host, port, user, password, sql_file):
-    """Execute SQL file using MySQL client."""
+    """Execute SQL file over a PyMySQL connection."""
     print(f"🔄 Executing SQL file: {sql_file}")
     
     if not sql_file.exists():
@@ -71,31 +94,35 @@ def execute_sql_file(host, port, user, password, sql_file):
         return False
     
     try:
-        # Build MySQL command
-        cmd = [
-            'mysql',
-            f'--host={host}',
-            f'--port={port}',
-            f'--user={user}',
-            f'--password={password}',
-            '--default-character-set=utf8mb4'
-        ]
-        
-        # Execute SQL file
-        with open(sql_file, 'r', encoding='utf-8') as f:
-            result = subprocess.run(cmd, stdin=f, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ SQL file executed successfully")
-            if result.stdout:
-                print(f"   Output: {result.stdout}")
-            return True
-        else:
-            print(f"❌ SQL execution failed: {result.stderr}")
-            return False
+        import pymysql
+        
+        # Run the script in-process instead of through the mysql client
+        connection = pymysql.connect(
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            charset='utf8mb4'
+        )
+        
+        executed = 0
+        try:
+            # Stream statements from disk rather than loading the whole dump
+            with open(sql_file, encoding='utf-8') as sql_lines, connection.cursor() as cursor:
+                for statement in split_sql_script(sql_lines):
+                    cursor.execute(statement)
+                    executed += 1
+                    if executed % 100 == 0:
+                        print(f"   ... {executed} statements executed")
+            connection.commit()
+        finally:
+            connection.close()
+        
+        print(f"✅ SQL file executed successfully ({executed} statements)")
+        return True
             
     except Exception as e:
-        print(f"❌ Error executing SQL file: {e}")
+        print(f"❌ SQL execution failed: {e}")
         return False
 
 def verify_database_setup():
@@ -103,35 +130,49 @@ def verify_database_setup():
     print("🔄 Verifying database setup...")
     
     try:
-        from app.core.config import settings
         from app.core.dependencies import engine
         from sqlalchemy import text
+        from sqlalchemy.exc import ProgrammingError
+        
+        tables_query = """
+            SELECT GROUP_CONCAT(table_name)
+            FROM information_schema.tables
+            WHERE table_schema = DATABASE()
+        """
         
-        # Test connection
         with engine.connect() as conn:
-            # Check if tables exist
-            result = conn.execute(text("SHOW TABLES"))
-            tables = [row[0] for row in result.fetchall()]
-            
-            expected_tables = ['users', 'share_events']
-            missing_tables = [t for t in expected_tables if t not in tables]
-            
-            if missing_tables:
-                print(f"❌ Missing tables: {missing_tables}")
-                return False
-            
-            print(f"✅ All tables found: {tables}")
-            
-            # Check sample data
-            result = conn.execute(text("SELECT COUNT(*) FROM users"))
-            user_count = result.fetchone()[0]
-            print(f"✅ Sample users: {user_count}")
-            
-            result = conn.execute(text("SELECT COUNT(*) FROM share_events"))
-            share_count = result.fetchone()[0]
-            print(f"✅ Sample share events: {share_count}")
-            
-            return True
+            try:
+                # Fetch the table list and both sample counts in one round-trip
+                row = conn.execute(text(f"""
+                    SELECT
+                        ({tables_query}) AS tables,
+                        (SELECT COUNT(*) FROM users) AS user_count,
+                        (SELECT COUNT(*) FROM share_events) AS share_count
+                """)).one()
+                table_list = row.tables
+            except ProgrammingError:
+                # A counted table is missing; fetch just the table list so
+                # the missing ones can be reported
+                conn.rollback()
+                row = None
+                table_list = conn.execute(text(tables_query)).scalar()
+        
+        tables = table_list.split(',') if table_list else []
+        
+        expected_tables = ['users', 'share_events']
+        missing_tables = [t for t in expected_tables if t not in tables]
+        
+        if missing_tables:
+            print(f"❌ Missing tables: {missing_tables}")
+            return False
+        
+        print(f"✅ All tables found: {tables}")
+        
+        # Check sample data
+        print(f"✅ Sample users: {row.user_count}")
+        print(f"✅ Sample share events: {row.share_count}")
+        
+        return True
             
     except Exception as e:
         print(f"❌ Database verification failed: {e}")
@@ -142,12 +183,6 @@ def main():
     print("🚀 Lawvriksh MySQL Database Setup")
     print("=" * 40)
     
-    # Check MySQL client
-    if not check_mysql_client():
-        print("\n💡 Alternative: You can manually execute the SQL file:")
-        print(f"   mysql -u root -p < {backend_dir}/lawdata.sql")
-        return
-    
     # Get MySQL connection details
     print("\n📋 MySQL Connection Details")
     host = input("MySQL Host (default: localhost): ").strip() or "localhost"
@@ -7,43 +7,145 @@ This script tests all API endpoints with proper error handling and reporting.
 import os
 import sys
 import json
+import heapq
+import threading
 import time
 import requests
-from typing import Dict, Optional, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Optional, Any, List, Tuple
+import dataclasses
+import functools
 from dataclasses import dataclass
 from datetime import datetime
 import logging
-
-# Configure logging with UTF-8 encoding
+from logging.handlers import MemoryHandler
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging with UTF-8 encoding. Console output stays live; file
+# records are buffered and written in batches (errors flush immediately)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+file_handler = logging.FileHandler('api_test_results.log', encoding='utf-8')
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+log_file_handler = MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=file_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('api_test_results.log', encoding='utf-8')
+        log_file_handler
     ]
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Number of slowest endpoints listed in the report
+SLOWEST_REPORTED = 3
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclasses, and anything else as its string form."""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text, with orjson when it is installed.
+
+    Dataclasses such as TestResult are serialized directly.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default)
+
+def requires_access_token(skipped_test: str) -> Callable:
+    """Skip the decorated test method, with a warning, until login has set a token."""
+    def decorator(test_method: Callable) -> Callable:
+        @functools.wraps(test_method)
+        def wrapper(self, *args, **kwargs):
+            if not self.access_token:
+                logger.warning(f"[WARNING] Skipping {skipped_test} - no access token")
+                return None
+            return test_method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+# Platforms exercised by the share tests
+SHARE_PLATFORMS = ["twitter", "facebook", "linkedin", "instagram"]
+
+# Client-side request budget. The API allows 60 requests per minute per IP
+# over a sliding window, so burst plus refill over any minute stays under it
+RATE_LIMIT_BURST = 30
+RATE_LIMIT_PER_SECOND = 0.5
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() only sleeps once the burst is spent."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting for it to refill if none is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the token now; a negative balance is the wait owed
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+@dataclass(frozen=True)
 class TestResult:
     """Data class to store test results."""
     name: str
     status_code: int
     success: bool
+    # Parsed response body; oversized bodies are kept as truncated JSON text
     response_data: Optional[Dict[str, Any]]
     error_message: Optional[str]
-    execution_time: float
+    execution_time_ns: int  # Monotonic nanoseconds; converted to seconds for display
 
 class APITester:
     """Comprehensive API testing class with proper error handling."""
 
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, legacy_shares: bool = False):
         self.base_url = base_url or os.getenv("API_BASE", "http://localhost:8000")
+        self.legacy_shares = legacy_shares
         self.session = requests.Session()
         self.session.timeout = 30  # 30 second timeout
+        # Explicit keep-alive pool sized for the concurrent test groups; no
+        # retries, so a failing endpoint fails fast
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=0))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.rate_limiter = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
         self.results: List[TestResult] = []
+        # Running totals for the report, updated as each result is recorded;
+        # tests run on several threads, so guard them with a lock
+        self._results_lock = threading.Lock()
+        self._passed_count = 0
+        self._total_time_ns = 0
+        self._slowest: List[Tuple[int, str]] = []
         self.access_token: Optional[str] = None
+        # Built once after login and passed per request; the session itself is
+        # shared by concurrent test groups, so its headers are never changed
+        self.user_headers: Dict[str, str] = {}
         self.admin_token: Optional[str] = None
 
         # Test data
@@ -58,6 +160,7 @@ class APITester:
     def make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request with proper error handling."""
         url = f"{self.base_url}{endpoint}"
+        self.rate_limiter.acquire()
         try:
             response = self.session.request(method, url, **kwargs)
             return response
@@ -68,17 +171,19 @@ class APITester:
     def test_endpoint(self, name: str, method: str, endpoint: str,
                      expected_status: int = 200, **kwargs) -> TestResult:
         """Test a single endpoint and record results."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             response = self.make_request(method, endpoint, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
 
-            # Try to parse JSON response
+            # Try to parse JSON response; the body bytes are read once and
+            # only the preview is decoded when it is not JSON
+            body = response.content
             try:
-                response_data = response.json()
-            except json.JSONDecodeError:
-                response_data = {"raw_response": response.text[:500]}
+                response_data = _json_loads(body)
+            except json.JSONDecodeError:  # orjson's decode error subclasses this
+                response_data = {"raw_response": body[:500].decode('utf-8', 'replace')}
 
             success = response.status_code == expected_status
             error_message = None if success else f"Expected {expected_status}, got {response.status_code}"
@@ -89,31 +194,43 @@ class APITester:
                 success=success,
                 response_data=response_data,
                 error_message=error_message,
-                execution_time=execution_time
+                execution_time_ns=execution_time_ns
             )
 
-            self.results.append(result)
-            self._log_result(result)
+            self._record_result(result)
             return result
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
             result = TestResult(
                 name=name,
                 status_code=0,
                 success=False,
                 response_data=None,
                 error_message=str(e),
-                execution_time=execution_time
+                execution_time_ns=execution_time_ns
             )
-            self.results.append(result)
-            self._log_result(result)
+            self._record_result(result)
             return result
 
+    def _record_result(self, result: TestResult):
+        """Store a test result, update the running report totals and log it."""
+        with self._results_lock:
+            self.results.append(result)
+            self._passed_count += result.success
+            self._total_time_ns += result.execution_time_ns
+            # Min-heap holding the slowest few results seen so far
+            entry = (result.execution_time_ns, result.name)
+            if len(self._slowest) < SLOWEST_REPORTED:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heappushpop(self._slowest, entry)
+        self._log_result(result)
+
     def _log_result(self, result: TestResult):
         """Log test result."""
         status = "[PASS]" if result.success else "[FAIL]"
-        logger.info(f"{status} {result.name} [{result.status_code}] ({result.execution_time:.2f}s)")
+        logger.info(f"{status} {result.name} [{result.status_code}] ({result.execution_time_ns / 1e9:.2f}s)")
 
         if not result.success:
             logger.error(f"   Error: {result.error_message}")
@@ -154,54 +271,51 @@ class APITester:
         if result.success and result.response_data:
             self.access_token = result.response_data.get("access_token")
             if self.access_token:
+                self.user_headers = {"Authorization": f"Bearer {self.access_token}"}
                 logger.info("[SUCCESS] Access token obtained successfully")
             else:
                 logger.warning("[WARNING] No access token in login response")
 
         return result
 
+    @requires_access_token("current user test")
     def test_get_current_user(self):
         """Test get current user endpoint."""
-        if not self.access_token:
-            logger.warning("[WARNING] Skipping current user test - no access token")
-            return None
-
-        headers = {"Authorization": f"Bearer {self.access_token}"}
         return self.test_endpoint(
             "Get Current User",
             "GET",
             "/auth/me",
-            headers=headers
+            headers=self.user_headers
         )
 
+    @requires_access_token("share tests")
     def test_share_endpoints(self):
         """Test all sharing endpoints."""
-        if not self.access_token:
-            logger.warning("[WARNING] Skipping share tests - no access token")
-            return []
-
-        headers = {"Authorization": f"Bearer {self.access_token}"}
         results = []
 
-        # Test sharing on different platforms
-        platforms = ["twitter", "facebook", "linkedin", "instagram"]
-        for platform in platforms:
-            result = self.test_endpoint(
-                f"Share on {platform.title()}",
-                "POST",
-                f"/shares/{platform}",
-                expected_status=201,
-                headers=headers
-            )
-            results.append(result)
-            time.sleep(0.5)  # Small delay between requests
+        if self.legacy_shares:
+            # Test sharing on different platforms, one request each; the
+            # shares are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=len(SHARE_PLATFORMS)) as executor:
+                results.extend(executor.map(
+                    lambda platform: self.test_endpoint(
+                        f"Share on {platform.title()}",
+                        "POST",
+                        f"/shares/{platform}",
+                        expected_status=201,
+                        headers=self.user_headers
+                    ),
+                    SHARE_PLATFORMS
+                ))
+        else:
+            results.append(self.test_bulk_share())
 
         # Test share history
         result = self.test_endpoint(
             "Share History",
             "GET",
             "/shares/history",
-            headers=headers
+            headers=self.user_headers
         )
         results.append(result)
 
@@ -210,12 +324,23 @@ class APITester:
             "Share Analytics",
             "GET",
             "/shares/analytics",
-            headers=headers
+            headers=self.user_headers
         )
         results.append(result)
 
         return results
 
+    def test_bulk_share(self):
+        """Test sharing on all platforms with a single bulk request."""
+        return self.test_endpoint(
+            "Bulk Share",
+            "POST",
+            "/shares/bulk",
+            expected_status=201,
+            headers=self.user_headers,
+            json={"events": [{"platform": platform} for platform in SHARE_PLATFORMS]}
+        )
+
     def test_leaderboard_endpoints(self):
         """Test leaderboard endpoints."""
         results = []
@@ -285,38 +410,49 @@ class APITester:
 
         return results
 
-    def run_all_tests(self):
-        """Run all API tests in sequence."""
-        logger.info("[START] Starting comprehensive API testing...")
-        logger.info(f"Target API: {self.base_url}")
-
-        # Test sequence
-        test_methods = [
-            self.test_health_check,
-            self.test_user_signup,
-            self.test_user_login,
-            self.test_get_current_user,
-            self.test_share_endpoints,
-            self.test_leaderboard_endpoints,
-            self.test_admin_endpoints,
-        ]
-
+    def _run_test_group(self, test_methods: List[Callable]):
+        """Run a group of dependent test methods in order."""
         for test_method in test_methods:
             try:
-                result = test_method()
-                if isinstance(result, list):
-                    # Handle methods that return multiple results
-                    continue
-                time.sleep(0.5)  # Small delay between test groups
+                test_method()
             except Exception as e:
                 logger.error(f"Test method {test_method.__name__} failed: {e}")
 
+    def _run_test_groups(self, test_groups: List[List[Callable]]):
+        """Run test groups in parallel, each group's methods in order."""
+        with ThreadPoolExecutor(max_workers=len(test_groups)) as executor:
+            list(executor.map(self._run_test_group, test_groups))
+
+    def run_all_tests(self):
+        """Run all API tests, overlapping the groups that share no state."""
+        logger.info("[START] Starting comprehensive API testing...")
+        logger.info(f"Target API: {self.base_url}")
+
+        # The user flow runs in order, since its later steps need the login
+        # token; the health check reads nothing it writes, so it runs alongside
+        self._run_test_groups([
+            [
+                self.test_user_signup,
+                self.test_user_login,
+                self.test_get_current_user,
+                self.test_share_endpoints,
+            ],
+            [self.test_health_check],
+        ])
+
+        # The leaderboard and admin views include the new user and their
+        # shares, so they only start once the user flow has finished
+        self._run_test_groups([
+            [self.test_leaderboard_endpoints],
+            [self.test_admin_endpoints],
+        ])
+
         self.generate_report()
 
     def generate_report(self):
         """Generate comprehensive test report."""
         total_tests = len(self.results)
-        passed_tests = sum(1 for r in self.results if r.success)
+        passed_tests = self._passed_count
         failed_tests = total_tests - passed_tests
 
         logger.info("\n" + "="*60)
@@ -334,46 +470,38 @@ class APITester:
                     logger.info(f"  - {result.name}: {result.error_message}")
 
         # Performance summary
-        avg_time = sum(r.execution_time for r in self.results) / total_tests
+        avg_time = self._total_time_ns / total_tests / 1e9
         logger.info(f"\n[PERFORMANCE] Average Response Time: {avg_time:.2f}s")
 
         # Slowest endpoints
-        slowest = sorted(self.results, key=lambda x: x.execution_time, reverse=True)[:3]
         logger.info("\n[SLOWEST ENDPOINTS]:")
-        for result in slowest:
-            logger.info(f"  - {result.name}: {result.execution_time:.2f}s")
+        for execution_time_ns, name in sorted(self._slowest, reverse=True):
+            logger.info(f"  - {name}: {execution_time_ns / 1e9:.2f}s")
 
         logger.info("="*60)
 
         # Save detailed report to file
         self.save_detailed_report()
 
+        log_file_handler.flush()
+
     def save_detailed_report(self):
         """Save detailed test report to JSON file."""
+        total_tests = len(self.results)
         report_data = {
             "timestamp": datetime.now().isoformat(),
             "base_url": self.base_url,
             "summary": {
-                "total_tests": len(self.results),
-                "passed": sum(1 for r in self.results if r.success),
-                "failed": sum(1 for r in self.results if not r.success),
-                "average_response_time": sum(r.execution_time for r in self.results) / len(self.results)
+                "total_tests": total_tests,
+                "passed": self._passed_count,
+                "failed": total_tests - self._passed_count,
+                "average_response_time": self._total_time_ns / total_tests / 1e9
             },
-            "results": [
-                {
-                    "name": r.name,
-                    "status_code": r.status_code,
-                    "success": r.success,
-                    "error_message": r.error_message,
-                    "execution_time": r.execution_time,
-                    "response_data": r.response_data
-                }
-                for r in self.results
-            ]
+            "results": self.results
         }
 
         with open("api_test_report.json", "w") as f:
-            json.dump(report_data, f, indent=2, default=str)
+            f.write(_json_dumps(report_data, indent=True))
 
         logger.info("[REPORT] Detailed report saved to api_test_report.json")
 
@@ -384,6 +512,7 @@ def main():
     parser = argparse.ArgumentParser(description="Comprehensive API Testing for Lawvriksh Backend")
     parser.add_argument("--url", default="http://localhost:8000", help="API base URL")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
+    parser.add_argument("--legacy", action="store_true", help="Share on each platform with its own request instead of /shares/bulk")
 
     args = parser.parse_args()
 
@@ -403,7 +532,7 @@ def main():
         sys.exit(1)
 
     # Run tests
-    tester = APITester(args.url)
+    tester = APITester(args.url, legacy_shares=args.legacy)
     tester.run_all_tests()
 
     # Exit with error code if any tests failed
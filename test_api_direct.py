@@ -5,9 +5,15 @@ Direct API test to verify the backend is working correctly
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive session shared by every request in this script
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+SESSION.headers["Connection"] = "keep-alive"
+
 def test_registration_and_stats():
     """Test user registration and stats retrieval"""
     
@@ -24,7 +30,7 @@ def test_registration_and_stats():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/auth/signup", json=registration_data)
+        response = SESSION.post(f"{BASE_URL}/auth/signup", json=registration_data)
         print(f"Registration Status: {response.status_code}")
         
         if response.status_code == 201:
@@ -39,7 +45,7 @@ def test_registration_and_stats():
                 "password": registration_data["password"]
             }
             
-            login_response = requests.post(f"{BASE_URL}/auth/login", json=login_data)
+            login_response = SESSION.post(f"{BASE_URL}/auth/login", json=login_data)
             print(f"Login Status: {login_response.status_code}")
             
             if login_response.status_code == 200:
@@ -52,7 +58,7 @@ def test_registration_and_stats():
                 # Test 3: Get user profile
                 print("\n3. Testing user profile...")
                 
-                profile_response = requests.get(f"{BASE_URL}/auth/me", headers=headers)
+                profile_response = SESSION.get(f"{BASE_URL}/auth/me", headers=headers)
                 print(f"Profile Status: {profile_response.status_code}")
                 
                 if profile_response.status_code == 200:
@@ -62,7 +68,7 @@ def test_registration_and_stats():
                 # Test 4: Get leaderboard around me
                 print("\n4. Testing leaderboard around-me...")
                 
-                around_me_response = requests.get(f"{BASE_URL}/leaderboard/around-me?range=5", headers=headers)
+                around_me_response = SESSION.get(f"{BASE_URL}/leaderboard/around-me?range=5", headers=headers)
                 print(f"Around Me Status: {around_me_response.status_code}")
                 
                 if around_me_response.status_code == 200:
@@ -74,7 +80,7 @@ def test_registration_and_stats():
                 # Test 5: Get public leaderboard
                 print("\n5. Testing public leaderboard...")
                 
-                leaderboard_response = requests.get(f"{BASE_URL}/leaderboard?page=1&limit=10")
+                leaderboard_response = SESSION.get(f"{BASE_URL}/leaderboard?page=1&limit=10")
                 print(f"Leaderboard Status: {leaderboard_response.status_code}")
                 
                 if leaderboard_response.status_code == 200:
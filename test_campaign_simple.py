@@ -7,18 +7,29 @@ Test the email campaign system by sending emails to Sahil.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from script_helpers import run_test
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_email_campaign_service = None
+
+def _campaign_service():
+    """Import the campaign service on first use and reuse it afterwards."""
+    global _email_campaign_service
+    if _email_campaign_service is None:
+        from app.services import email_campaign_service
+        _email_campaign_service = email_campaign_service
+    return _email_campaign_service
+
 def test_welcome_email():
     """Test sending welcome email to Sahil."""
     try:
-        from app.services.email_campaign_service import send_welcome_email_campaign
-        
         logger.info("📧 Testing Welcome Email Campaign")
-        result = send_welcome_email_campaign('sahilsaurav2507@gmail.com', 'Sahil Saurav')
+        result = _campaign_service().send_welcome_email_campaign('sahilsaurav2507@gmail.com', 'Sahil Saurav')
         
         if result:
             logger.info("✅ Welcome email sent successfully to Sahil!")
@@ -34,10 +45,8 @@ def test_welcome_email():
 def test_campaign_email(campaign_type):
     """Test sending a specific campaign email to Sahil."""
     try:
-        from app.services.email_campaign_service import send_scheduled_campaign_email
-        
         logger.info(f"📧 Testing {campaign_type} Campaign Email")
-        result = send_scheduled_campaign_email(campaign_type, 'sahilsaurav2507@gmail.com', 'Sahil Saurav')
+        result = _campaign_service().send_scheduled_campaign_email(campaign_type, 'sahilsaurav2507@gmail.com', 'Sahil Saurav')
         
         if result:
             logger.info(f"✅ {campaign_type} email sent successfully to Sahil!")
@@ -53,10 +62,8 @@ def test_campaign_email(campaign_type):
 def test_campaign_schedule():
     """Test campaign schedule functionality."""
     try:
-        from app.services.email_campaign_service import get_campaign_schedule
-        
         logger.info("📅 Testing Campaign Schedule")
-        schedule = get_campaign_schedule()
+        schedule = _campaign_service().get_campaign_schedule()
         
         logger.info(f"✅ Found {len(schedule)} campaigns:")
         for campaign_type, details in schedule.items():
@@ -84,19 +91,11 @@ def main():
         ("Platform Complete Email", lambda: test_campaign_email("platform_complete")),
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        logger.info(f"\n🔄 Running: {test_name}")
-        try:
-            result = test_func()
-            results.append(result)
-            if result:
-                logger.info(f"✅ {test_name}: PASSED")
-            else:
-                logger.error(f"❌ {test_name}: FAILED")
-        except Exception as e:
-            logger.error(f"❌ {test_name}: FAILED with exception: {e}")
-            results.append(False)
+    # The schedule check is local; the campaign emails are independent and
+    # mostly wait on SMTP, so send them concurrently
+    results = [run_test(*tests[0])]
+    with ThreadPoolExecutor(max_workers=len(tests) - 1) as executor:
+        results.extend(executor.map(lambda test: run_test(*test), tests[1:]))
     
     # Final results
     passed = sum(results)
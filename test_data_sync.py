@@ -15,37 +15,74 @@ Usage:
     python test_data_sync.py
 """
 
-import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from script_helpers import AdminAuth, parse_json, pooled_session
+
 BASE_URL = "http://localhost:8000"
 
+# Endpoint URLs, built once
+SIGNUP_URL = f"{BASE_URL}/auth/signup"
+LOGIN_URL = f"{BASE_URL}/auth/login"
+ADMIN_DASHBOARD_URL = f"{BASE_URL}/admin/dashboard"
+LEADERBOARD_URL = f"{BASE_URL}/leaderboard?page=1&limit=10"
+FACEBOOK_SHARE_URL = f"{BASE_URL}/shares/facebook"
+SHARE_ANALYTICS_URL = f"{BASE_URL}/shares/analytics/enhanced"
+
+# One keep-alive session shared by every request in this script
+SESSION = pooled_session()
+
+# Admin token for the dashboard requests, reused across runs
+ADMIN_AUTH = AdminAuth(SESSION, BASE_URL, "admin@lawvriksh.com", "admin123")
+
+# Runs requests that don't depend on the step in progress in the background
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+def find_leaderboard_user(leaderboard_data, user_id):
+    """Return the leaderboard entry for user_id, or None if the user isn't listed."""
+    entries_by_id = {entry['user_id']: entry for entry in leaderboard_data['leaderboard']}
+    return entries_by_id.get(user_id)
+
+def wait_until(predicate, timeout=5.0, interval=0.1):
+    """Call predicate until it returns a truthy value or timeout seconds pass; return its last result."""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = predicate()
+        if result or time.monotonic() >= deadline:
+            return result
+        time.sleep(interval)
+
 def test_complete_data_sync():
     """Test complete data synchronization flow."""
     print("🔄 Testing Complete Data Synchronization Flow")
     print("=" * 50)
     
+    # One timestamp per run keeps the user's name, email and the leaderboard
+    # cache-buster consistent with each other
+    run_ts = time.time_ns()
+    
     # Step 1: Create a test user
     print("\n1️⃣ Creating test user...")
     test_user = {
-        "name": f"Sync Test User {int(time.time())}",
-        "email": f"synctest{int(time.time())}@example.com",
+        "name": f"Sync Test User {run_ts}",
+        "email": f"synctest{run_ts}@example.com",
         "password": "testpassword123"
     }
     
-    signup_response = requests.post(f"{BASE_URL}/auth/signup", json=test_user)
+    signup_response = SESSION.post(SIGNUP_URL, json=test_user)
     if signup_response.status_code != 201:
         print(f"❌ Signup failed: {signup_response.text}")
         return False
     
-    user_data = signup_response.json()
+    user_data = parse_json(signup_response)
     print(f"✅ User created: {user_data['name']} (ID: {user_data['user_id']})")
     
     # Step 2: Login to get token
     print("\n2️⃣ Logging in...")
-    login_response = requests.post(f"{BASE_URL}/auth/login", json={
+    login_response = SESSION.post(LOGIN_URL, json={
         "email": test_user["email"],
         "password": test_user["password"]
     })
@@ -54,27 +91,25 @@ def test_complete_data_sync():
         print(f"❌ Login failed: {login_response.text}")
         return False
     
-    token = login_response.json()["access_token"]
+    token = parse_json(login_response)["access_token"]
     headers = {"Authorization": f"Bearer {token}"}
     print("✅ Login successful")
     
+    # The initial leaderboard (step 4) doesn't need the admin login, so
+    # fetch it while step 3 runs
+    initial_leaderboard_future = EXECUTOR.submit(SESSION.get, LEADERBOARD_URL)
+    
     # Step 3: Get initial admin dashboard stats
     print("\n3️⃣ Getting initial admin dashboard stats...")
-    admin_login = requests.post(f"{BASE_URL}/auth/login", json={
-        "email": "admin@lawvriksh.com",
-        "password": "admin123"
-    })
-    
-    if admin_login.status_code != 200:
-        print(f"❌ Admin login failed: {admin_login.text}")
+    if ADMIN_AUTH.token_from_cache:
+        print("✅ Reusing cached admin token")
+    elif not ADMIN_AUTH.login():
         return False
     
-    admin_token = admin_login.json()["access_token"]
-    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+    initial_dashboard = SESSION.get(ADMIN_DASHBOARD_URL, auth=ADMIN_AUTH)
     
-    initial_dashboard = requests.get(f"{BASE_URL}/admin/dashboard", headers=admin_headers)
     if initial_dashboard.status_code == 200:
-        initial_stats = initial_dashboard.json()
+        initial_stats = parse_json(initial_dashboard)
         print(f"✅ Initial stats - Total shares today: {initial_stats['overview']['total_shares_today']}")
         print(f"   Points distributed today: {initial_stats['overview']['points_distributed_today']}")
     else:
@@ -83,17 +118,13 @@ def test_complete_data_sync():
     
     # Step 4: Get initial leaderboard
     print("\n4️⃣ Getting initial leaderboard...")
-    initial_leaderboard = requests.get(f"{BASE_URL}/leaderboard?page=1&limit=10")
+    initial_leaderboard = initial_leaderboard_future.result()
     if initial_leaderboard.status_code == 200:
-        leaderboard_data = initial_leaderboard.json()
+        leaderboard_data = parse_json(initial_leaderboard)
         print(f"✅ Initial leaderboard has {len(leaderboard_data['leaderboard'])} users")
         
         # Find our user in leaderboard
-        our_user = None
-        for user in leaderboard_data['leaderboard']:
-            if user['user_id'] == user_data['user_id']:
-                our_user = user
-                break
+        our_user = find_leaderboard_user(leaderboard_data, user_data['user_id'])
         
         if our_user:
             print(f"   Our user rank: {our_user['rank']}, points: {our_user['points']}, shares: {our_user['shares_count']}")
@@ -104,27 +135,42 @@ def test_complete_data_sync():
     
     # Step 5: Share on Facebook (3 points)
     print("\n5️⃣ Sharing on Facebook...")
-    share_response = requests.post(f"{BASE_URL}/shares/facebook", headers=headers)
+    share_response = SESSION.post(FACEBOOK_SHARE_URL, headers=headers)
     
     if share_response.status_code != 201:
         print(f"❌ Share failed: {share_response.text}")
         return False
     
-    share_data = share_response.json()
+    share_data = parse_json(share_response)
     print(f"✅ Share successful!")
     print(f"   Points earned: {share_data['points_earned']}")
     print(f"   Total points: {share_data['total_points']}")
     print(f"   New rank: {share_data.get('new_rank', 'N/A')}")
     
-    # Step 6: Wait a moment for cache invalidation
+    # The user's own analytics (step 9) don't go through the leaderboard
+    # cache, so fetch them while waiting for invalidation
+    analytics_future = EXECUTOR.submit(SESSION.get, SHARE_ANALYTICS_URL, headers=headers)
+    
+    # Step 6: Wait for cache invalidation by polling the dashboard until it
+    # reflects the share, instead of sleeping a fixed amount
     print("\n6️⃣ Waiting for cache invalidation...")
-    time.sleep(2)
+    polled = {}
+    
+    def dashboard_reflects_share():
+        response = SESSION.get(ADMIN_DASHBOARD_URL, auth=ADMIN_AUTH)
+        polled['dashboard'] = response
+        if response.status_code != 200:
+            return True  # Nothing to wait for; step 7 reports the failure
+        polled['stats'] = parse_json(response)
+        return polled['stats']['overview']['total_shares_today'] > initial_stats['overview']['total_shares_today']
+    
+    wait_until(dashboard_reflects_share)
     
-    # Step 7: Check updated admin dashboard
+    # Step 7: Check updated admin dashboard, using the last polled response
     print("\n7️⃣ Checking updated admin dashboard...")
-    updated_dashboard = requests.get(f"{BASE_URL}/admin/dashboard", headers=admin_headers)
+    updated_dashboard = polled['dashboard']
     if updated_dashboard.status_code == 200:
-        updated_stats = updated_dashboard.json()
+        updated_stats = polled['stats']
         shares_increase = updated_stats['overview']['total_shares_today'] - initial_stats['overview']['total_shares_today']
         points_increase = updated_stats['overview']['points_distributed_today'] - initial_stats['overview']['points_distributed_today']
         
@@ -144,16 +190,12 @@ def test_complete_data_sync():
     
     # Step 8: Check updated leaderboard
     print("\n8️⃣ Checking updated leaderboard...")
-    updated_leaderboard = requests.get(f"{BASE_URL}/leaderboard?page=1&limit=10&_t={int(time.time())}")
+    updated_leaderboard = SESSION.get(f"{LEADERBOARD_URL}&_t={run_ts}")
     if updated_leaderboard.status_code == 200:
-        updated_leaderboard_data = updated_leaderboard.json()
+        updated_leaderboard_data = parse_json(updated_leaderboard)
         
         # Find our user in updated leaderboard
-        updated_user = None
-        for user in updated_leaderboard_data['leaderboard']:
-            if user['user_id'] == user_data['user_id']:
-                updated_user = user
-                break
+        updated_user = find_leaderboard_user(updated_leaderboard_data, user_data['user_id'])
         
         if updated_user:
             print(f"✅ Our user in leaderboard:")
@@ -172,9 +214,9 @@ def test_complete_data_sync():
     
     # Step 9: Check share analytics
     print("\n9️⃣ Checking share analytics...")
-    analytics_response = requests.get(f"{BASE_URL}/shares/analytics/enhanced", headers=headers)
+    analytics_response = analytics_future.result()
     if analytics_response.status_code == 200:
-        analytics_data = analytics_response.json()
+        analytics_data = parse_json(analytics_response)
         print(f"✅ Share analytics loaded:")
         print(f"   Total shares: {analytics_data['summary']['total_shares']}")
         print(f"   Total points: {analytics_data['summary']['total_points']}")
@@ -196,6 +238,7 @@ def test_complete_data_sync():
 
 if __name__ == "__main__":
     try:
-        test_complete_data_sync()
+        with SESSION, EXECUTOR:
+            test_complete_data_sync()
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
@@ -89,25 +89,27 @@ def test_session_creation():
         traceback.print_exc()
         return False
 
-def test_table_creation():
+def check_table_creation(engine):
     """Test table creation."""
     print("\n🔄 Testing table creation...")
     
     try:
-        from app.core.dependencies import engine
         from app.core.database import Base
         
         # Import all models to ensure they're registered
         from app.models import user, share
         
-        # Create tables
-        Base.metadata.create_all(bind=engine)
-        print("✅ Tables created successfully")
-        
-        # List created tables
+        # Create tables, unless every model's table is already there
         from sqlalchemy import inspect
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
+        tables = inspect(engine).get_table_names()
+        if set(Base.metadata.tables).issubset(tables):
+            print("✅ Schema already present, skipping table creation")
+        else:
+            Base.metadata.create_all(bind=engine)
+            print("✅ Tables created successfully")
+            tables = inspect(engine).get_table_names()
+        
+        # List tables
         print(f"   Tables: {tables}")
         
         return True
@@ -155,28 +157,24 @@ def test_mysql_connection(host="localhost", port=3306, user="lawuser", password=
         print("   - Firewall blocking connection")
         return False
 
-def check_mysql_server():
+def check_mysql_server(settings):
     """Check if MySQL server is accessible."""
     print("\n🔄 Checking MySQL server accessibility...")
 
     try:
-        settings = test_config_loading()
-        if not settings:
-            return False
-
         if 'mysql' not in settings.database_url:
             print("⚠️  Not using MySQL database")
             return False
 
         # Extract connection details from DATABASE_URL
-        import re
-        match = re.match(r'mysql\+pymysql://([^:]+):([^@]+)@([^:]+):(\d+)/(.+)', settings.database_url)
-        if match:
-            user, password, host, port, database = match.groups()
-            return test_mysql_connection(host, int(port), user, password, database)
-        else:
+        from sqlalchemy.engine.url import make_url
+        from sqlalchemy.exc import ArgumentError
+        try:
+            url = make_url(settings.database_url)
+        except ArgumentError:
             print("❌ Could not parse MySQL connection string")
             return False
+        return test_mysql_connection(url.host or "localhost", url.port or 3306, url.username, url.password or "", url.database)
 
     except Exception as e:
         print(f"❌ MySQL server check failed: {e}")
@@ -197,7 +195,7 @@ def main():
     
     # Check if using MySQL
     if 'mysql' in settings.database_url:
-        mysql_ok = check_mysql_server()
+        mysql_ok = check_mysql_server(settings)
         if not mysql_ok:
             print("⚠️  MySQL server check failed, but continuing with other tests...")
     else:
@@ -219,11 +217,7 @@ def main():
         return
     
     # Test table creation
-    tables_ok = test_table_creation()
-    
-    # If using MySQL, test direct MySQL connection
-    if 'mysql' in settings.database_url:
-        test_mysql_connection()
+    tables_ok = check_table_creation(engine)
     
     print("\n" + "=" * 50)
     if connection_ok and session_ok and tables_ok:
@@ -19,14 +19,19 @@ Usage:
     python test_email_and_background_tasks.py
 """
 
+import atexit
 import smtplib
 import logging
 import json
-import time
 from datetime import datetime
 from email.mime.text import MIMEText
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +48,51 @@ class EmailAndBackgroundTasksTest:
             "name": "Sahil Saurav",
             "email": "sahilsaurav2507@gmail.com"
         }
+        self._smtp = None
+        self._rmq_conn = None
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return the shared SMTP session, connecting and logging in on first use."""
+        if self._smtp is None:
+            from app.core.config import settings
+            
+            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
+            try:
+                server.starttls()
+                if settings.SMTP_USER and settings.SMTP_PASSWORD:
+                    server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+            except smtplib.SMTPException:
+                server.close()
+                raise
+            self._smtp = server
+            atexit.register(self._close_smtp)
+        return self._smtp
+    
+    def _close_smtp(self):
+        """Close the shared SMTP session, if one is open."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+    
+    def _get_rmq_connection(self):
+        """Return the shared RabbitMQ connection, reconnecting if it was closed."""
+        import pika
+        from app.core.config import settings
+        
+        if self._rmq_conn is None or self._rmq_conn.is_closed:
+            if self._rmq_conn is None:
+                atexit.register(self._close_rmq_connection)
+            self._rmq_conn = pika.BlockingConnection(pika.URLParameters(settings.RABBITMQ_URL))
+        return self._rmq_conn
+    
+    def _close_rmq_connection(self):
+        """Close the shared RabbitMQ connection, if one is open."""
+        if self._rmq_conn is not None and self._rmq_conn.is_open:
+            self._rmq_conn.close()
+        self._rmq_conn = None
     
     def log_test_result(self, test_name: str, success: bool, details: Dict[str, Any] = None):
         """Log test result with details."""
@@ -67,14 +117,11 @@ class EmailAndBackgroundTasksTest:
         try:
             from app.core.config import settings
             
-            email_config = {
-                "EMAIL_FROM": getattr(settings, 'EMAIL_FROM', None),
-                "SMTP_HOST": getattr(settings, 'SMTP_HOST', None),
-                "SMTP_PORT": getattr(settings, 'SMTP_PORT', None),
-                "SMTP_USER": getattr(settings, 'SMTP_USER', None),
-                "SMTP_PASSWORD": bool(getattr(settings, 'SMTP_PASSWORD', None)),
-                "RABBITMQ_URL": getattr(settings, 'RABBITMQ_URL', None)
-            }
+            email_config = settings.model_dump(include={
+                "EMAIL_FROM", "SMTP_HOST", "SMTP_PORT", "SMTP_USER", "SMTP_PASSWORD", "RABBITMQ_URL"
+            })
+            # Only report whether the password is set, never its value
+            email_config["SMTP_PASSWORD"] = bool(email_config["SMTP_PASSWORD"])
             
             missing_configs = [k for k, v in email_config.items() if not v]
             success = len(missing_configs) == 0
@@ -101,11 +148,8 @@ class EmailAndBackgroundTasksTest:
                 self.log_test_result("SMTP Connectivity", False, {"error": "SMTP configuration incomplete"})
                 return False
             
-            # Test SMTP connection
-            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-            server.starttls()
-            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.quit()
+            # Test SMTP connection; the session stays open for the email test
+            self._get_smtp().noop()
             
             details = {
                 "smtp_host": settings.SMTP_HOST,
@@ -128,18 +172,17 @@ class EmailAndBackgroundTasksTest:
     def test_rabbitmq_connectivity(self) -> bool:
         """Test RabbitMQ connectivity for Celery."""
         try:
-            import pika
             from app.core.config import settings
             
-            # Parse RabbitMQ URL
-            connection = pika.BlockingConnection(pika.URLParameters(settings.RABBITMQ_URL))
-            channel = connection.channel()
+            channel = self._get_rmq_connection().channel()
             
-            # Test basic operations
-            channel.queue_declare(queue='test_queue', durable=True)
-            channel.queue_delete(queue='test_queue')
+            # Test basic operations on a transient, broker-named queue. Exclusive
+            # queues only go away with their connection, which is kept open, so
+            # the queue is still deleted explicitly
+            declared = channel.queue_declare(queue='', durable=False, exclusive=True)
+            channel.queue_delete(queue=declared.method.queue)
             
-            connection.close()
+            channel.close()
             
             details = {
                 "rabbitmq_url": settings.RABBITMQ_URL,
@@ -218,8 +261,8 @@ class EmailAndBackgroundTasksTest:
                 self.log_test_result("Email Service Function", True, details)
                 return True
             
-            # Send welcome email
-            send_welcome_email(self.test_user["email"], self.test_user["name"])
+            # Send welcome email over the session opened by the connectivity test
+            send_welcome_email(self.test_user["email"], self.test_user["name"], smtp=self._get_smtp())
             
             details = {
                 "recipient": self.test_user["email"],
@@ -244,6 +287,7 @@ class EmailAndBackgroundTasksTest:
         """Test Celery task queuing for welcome email."""
         try:
             from app.tasks.email_tasks import send_welcome_email_task
+            from celery.exceptions import TimeoutError as CeleryTimeoutError
             
             # Queue the welcome email task
             task_result = send_welcome_email_task.delay(
@@ -251,8 +295,11 @@ class EmailAndBackgroundTasksTest:
                 self.test_user["name"]
             )
             
-            # Wait a bit for task to be processed
-            time.sleep(2)
+            # Wait for the worker to report back, returning as soon as it does
+            try:
+                task_result.get(timeout=10, propagate=False)
+            except CeleryTimeoutError:
+                pass  # Still queued or running; reported with its current status
             
             # Check task status
             task_status = task_result.status
@@ -343,7 +390,6 @@ class EmailAndBackgroundTasksTest:
             try:
                 if test_function():
                     passed_tests += 1
-                time.sleep(1)  # Small delay between tests
             except Exception as e:
                 logger.error(f"Test {test_name} failed with exception: {e}")
         
@@ -378,8 +424,13 @@ class EmailAndBackgroundTasksTest:
             "test_results": self.test_results
         }
         
-        with open(f"email_background_tasks_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json", "w") as f:
-            json.dump(report, f, indent=2)
+        report_path = f"email_background_tasks_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        if orjson is not None:
+            with open(report_path, "wb") as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, "w") as f:
+                json.dump(report, f, indent=2)
         
         return report
 
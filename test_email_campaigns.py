@@ -16,13 +16,20 @@ Usage:
     python test_email_campaigns.py --url http://localhost:8000
 """
 
-import requests
 import time
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 
+from script_helpers import (
+    AdminAuth,
+    parse_json,
+    pooled_session,
+    run_test,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -32,29 +39,25 @@ class EmailCampaignTest:
     
     def __init__(self, base_url):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self.session = pooled_session()
         self.session.timeout = 30
         self.admin_token = None
         
     def get_admin_token(self):
-        """Get admin token for API access."""
+        """Get admin token for API access, reusing a cached one when it is still valid."""
+        admin_auth = AdminAuth(self.session, self.base_url, "admin@lawvriksh.com", "password123")
         try:
-            # Try to login as admin
-            admin_credentials = {
-                "email": "admin@lawvriksh.com",
-                "password": "password123"
-            }
-            
-            response = self.session.post(f"{self.base_url}/auth/login", json=admin_credentials)
-            
-            if response.status_code == 200:
-                token_data = response.json()
-                self.admin_token = token_data.get("access_token")
+            if admin_auth.token_from_cache:
+                logger.info("✅ Using cached admin token")
+            elif admin_auth.login():
                 logger.info("✅ Admin token obtained successfully")
-                return True
             else:
-                logger.error(f"❌ Failed to get admin token: {response.status_code}")
                 return False
+            
+            self.admin_token = admin_auth.token
+            # Every campaign endpoint needs the admin token, so send it with all requests
+            self.session.auth = admin_auth
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Error getting admin token: {e}")
@@ -69,11 +72,10 @@ class EmailCampaignTest:
             return False
         
         try:
-            headers = {"Authorization": f"Bearer {self.admin_token}"}
-            response = self.session.get(f"{self.base_url}/campaigns/schedule", headers=headers)
+            response = self.session.get(f"{self.base_url}/campaigns/schedule")
             
             if response.status_code == 200:
-                schedule_data = response.json()
+                schedule_data = parse_json(response)
                 campaigns = schedule_data.get("campaigns", {})
                 due_campaigns = schedule_data.get("due_campaigns", [])
                 
@@ -106,14 +108,18 @@ class EmailCampaignTest:
             return False
         
         try:
-            headers = {"Authorization": f"Bearer {self.admin_token}"}
             campaigns = ["welcome", "search_engine", "portfolio_builder", "platform_complete"]
             
-            for campaign_type in campaigns:
-                response = self.session.get(f"{self.base_url}/campaigns/preview/{campaign_type}", headers=headers)
-                
+            # The previews are independent reads, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=len(campaigns)) as executor:
+                responses = list(executor.map(
+                    lambda ct: self.session.get(f"{self.base_url}/campaigns/preview/{ct}"),
+                    campaigns
+                ))
+            
+            for campaign_type, response in zip(campaigns, responses):
                 if response.status_code == 200:
-                    preview_data = response.json()
+                    preview_data = parse_json(response)
                     subject = preview_data.get("subject", "")
                     logger.info(f"✅ {campaign_type}: {subject}")
                 else:
@@ -135,11 +141,10 @@ class EmailCampaignTest:
             return False
         
         try:
-            headers = {"Authorization": f"Bearer {self.admin_token}"}
-            response = self.session.post(f"{self.base_url}/campaigns/test-sahil?campaign_type=welcome", headers=headers)
+            response = self.session.post(f"{self.base_url}/campaigns/test-sahil?campaign_type=welcome")
             
             if response.status_code == 200:
-                result = response.json()
+                result = parse_json(response)
                 task_id = result.get("task_id")
                 logger.info("✅ Welcome email sent to Sahil Saurav")
                 logger.info(f"   Task ID: {task_id}")
@@ -153,8 +158,14 @@ class EmailCampaignTest:
             logger.error(f"❌ Error sending welcome email to Sahil: {e}")
             return False
     
-    def test_campaign_email_to_sahil(self, campaign_type):
-        """Test sending a specific campaign email to Sahil."""
+    def test_campaign_email_to_sahil(self, campaign_type, pending_response=None):
+        """
+        Test sending a specific campaign email to Sahil.
+
+        pending_response is an optional future for a test-sahil request that
+        was already submitted; when given, its response is checked instead of
+        posting again.
+        """
         logger.info(f"🔄 Testing {campaign_type} Email to Sahil")
         
         if not self.admin_token:
@@ -162,11 +173,13 @@ class EmailCampaignTest:
             return False
         
         try:
-            headers = {"Authorization": f"Bearer {self.admin_token}"}
-            response = self.session.post(f"{self.base_url}/campaigns/test-sahil?campaign_type={campaign_type}", headers=headers)
+            if pending_response is not None:
+                response = pending_response.result()
+            else:
+                response = self.session.post(f"{self.base_url}/campaigns/test-sahil?campaign_type={campaign_type}")
             
             if response.status_code == 200:
-                result = response.json()
+                result = parse_json(response)
                 task_id = result.get("task_id")
                 logger.info(f"✅ {campaign_type} email sent to Sahil Saurav")
                 logger.info(f"   Task ID: {task_id}")
@@ -195,7 +208,7 @@ class EmailCampaignTest:
             response = self.session.post(f"{self.base_url}/auth/signup", json=user_data)
             
             if response.status_code == 201:
-                user_response = response.json()
+                user_response = parse_json(response)
                 logger.info("✅ New user registered successfully")
                 logger.info(f"   User: {user_response.get('name')}")
                 logger.info(f"   Email: {user_response.get('email')}")
@@ -218,14 +231,17 @@ class EmailCampaignTest:
             return False
         
         try:
-            headers = {"Authorization": f"Bearer {self.admin_token}"}
             campaigns = ["welcome", "search_engine", "portfolio_builder", "platform_complete"]
             
-            for campaign_type in campaigns:
-                response = self.session.get(f"{self.base_url}/campaigns/status/{campaign_type}", headers=headers)
-                
+            with ThreadPoolExecutor(max_workers=len(campaigns)) as executor:
+                responses = list(executor.map(
+                    lambda ct: self.session.get(f"{self.base_url}/campaigns/status/{ct}"),
+                    campaigns
+                ))
+            
+            for campaign_type, response in zip(campaigns, responses):
                 if response.status_code == 200:
-                    status_data = response.json()
+                    status_data = parse_json(response)
                     is_due = status_data.get("is_due", False)
                     schedule = status_data.get("schedule", "")
                     logger.info(f"✅ {campaign_type}: Due={is_due}, Schedule={schedule}")
@@ -246,8 +262,6 @@ class EmailCampaignTest:
         logger.info(f"API URL: {self.base_url}")
         logger.info("=" * 60)
         
-        test_results = []
-        
         # Get admin token first
         if not self.get_admin_token():
             logger.error("❌ Cannot proceed without admin token")
@@ -262,26 +276,26 @@ class EmailCampaignTest:
             ("New User Registration", self.test_new_user_registration_with_welcome_email),
         ]
         
-        # Test individual campaign emails to Sahil
-        campaign_types = ["search_engine", "portfolio_builder", "platform_complete"]
-        for campaign_type in campaign_types:
-            tests.append((f"Sahil {campaign_type.title()} Email", 
-                         lambda ct=campaign_type: self.test_campaign_email_to_sahil(ct)))
-        
         # Run all tests
-        for test_name, test_function in tests:
-            logger.info(f"\n🔄 Running: {test_name}")
-            try:
-                result = test_function()
-                test_results.append(result)
-                if result:
-                    logger.info(f"✅ {test_name}: PASSED")
-                else:
-                    logger.error(f"❌ {test_name}: FAILED")
-                time.sleep(1)  # Brief pause between tests
-            except Exception as e:
-                logger.error(f"❌ {test_name}: FAILED with exception: {e}")
-                test_results.append(False)
+        test_results = [run_test(test_name, test_function) for test_name, test_function in tests]
+        
+        # Test individual campaign emails to Sahil, once the checks above have
+        # run. The three sends are independent, so post them together and
+        # then check each response as its own test
+        campaign_types = ["search_engine", "portfolio_builder", "platform_complete"]
+        with ThreadPoolExecutor(max_workers=len(campaign_types)) as executor:
+            pending = {
+                campaign_type: executor.submit(
+                    self.session.post,
+                    f"{self.base_url}/campaigns/test-sahil?campaign_type={campaign_type}"
+                )
+                for campaign_type in campaign_types
+            }
+            for campaign_type in campaign_types:
+                test_results.append(run_test(
+                    f"Sahil {campaign_type.title()} Email",
+                    lambda ct=campaign_type: self.test_campaign_email_to_sahil(ct, pending[ct])
+                ))
         
         # Final results
         passed_tests = sum(test_results)
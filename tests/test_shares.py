@@ -1,6 +1,8 @@
 import pytest
+from unittest.mock import patch
 from fastapi import status
-from app.models.share import PlatformEnum
+from app.models.share import PlatformEnum, ShareEvent
+from app.services.share_service import log_share_events
 
 class TestShares:
     def test_share_first_time_success(self, client, auth_headers):
@@ -55,6 +57,86 @@ class TestShares:
         response = client.post("/shares/twitter")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+    def test_share_bulk_success(self, client, auth_headers):
+        """Test sharing on several platforms in one request."""
+        response = client.post("/shares/bulk", headers=auth_headers, json={
+            "events": [{"platform": "twitter"}, {"platform": "linkedin"}]
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["shares"] == [
+            {"platform": "twitter", "points_earned": 1},
+            {"platform": "linkedin", "points_earned": 5}
+        ]
+        assert data["points_earned"] == 6
+        assert data["total_points"] == 6
+
+    def test_share_bulk_duplicate_in_request(self, client, auth_headers):
+        """Test a platform repeated within one bulk request only earns points once."""
+        response = client.post("/shares/bulk", headers=auth_headers, json={
+            "events": [{"platform": "facebook"}, {"platform": "facebook"}]
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [share["points_earned"] for share in data["shares"]] == [3, 0]
+        assert data["total_points"] == 3
+
+    def test_share_bulk_platform_already_shared(self, client, auth_headers):
+        """Test a platform already shared on earns no points in a bulk request."""
+        client.post("/shares/instagram", headers=auth_headers)
+
+        response = client.post("/shares/bulk", headers=auth_headers, json={
+            "events": [{"platform": "instagram"}, {"platform": "twitter"}]
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [share["points_earned"] for share in data["shares"]] == [0, 1]
+        assert data["points_earned"] == 1
+        assert data["total_points"] == 3
+
+    def test_share_bulk_counts_every_share(self, client, auth_headers):
+        """Test the share metric counts every share, like the single-platform endpoint."""
+        with patch("app.api.shares.inc_share_event") as inc_share_event:
+            client.post("/shares/bulk", headers=auth_headers, json={
+                "events": [{"platform": "twitter"}, {"platform": "twitter"}]
+            })
+        assert inc_share_event.call_count == 2
+
+    def test_share_bulk_invalid_platform(self, client, auth_headers):
+        """Test a bulk request with an unknown platform records nothing."""
+        response = client.post("/shares/bulk", headers=auth_headers, json={
+            "events": [{"platform": "twitter"}, {"platform": "invalid_platform"}]
+        })
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        history = client.get("/shares/history", headers=auth_headers)
+        assert history.json()["pagination"]["total"] == 0
+
+    def test_share_bulk_empty(self, client, auth_headers):
+        """Test a bulk request with no events is rejected."""
+        response = client.post("/shares/bulk", headers=auth_headers, json={"events": []})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_share_bulk_unauthorized(self, client):
+        """Test bulk sharing without authentication."""
+        response = client.post("/shares/bulk", json={"events": [{"platform": "twitter"}]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_log_share_events(self, db_session, test_user):
+        """Test log_share_events inserts one event per new platform and updates the user."""
+        user, awarded = log_share_events(
+            db_session, test_user.id,
+            [PlatformEnum.linkedin, PlatformEnum.twitter, PlatformEnum.linkedin]
+        )
+        assert awarded == [
+            (PlatformEnum.linkedin, 5),
+            (PlatformEnum.twitter, 1),
+            (PlatformEnum.linkedin, 0)
+        ]
+        assert user.total_points == 6
+        assert user.shares_count == 2
+        assert db_session.query(ShareEvent).filter(ShareEvent.user_id == test_user.id).count() == 2
+
     def test_share_history_success(self, client, auth_headers):
         """Test getting share history."""
         # Create some shares first